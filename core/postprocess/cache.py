@@ -0,0 +1,160 @@
+"""Optional on-disk cache of LLM classification verdicts."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import stat
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, TextIO, Tuple
+
+from core.tab_policy.taxonomy import POSTPROCESS_KIND_ORDER
+
+from .coerce import normalize_action
+from .models import Item
+
+DEFAULT_CACHE_PATH = Path("~/Library/Application Support/TabDump/classify-cache.sqlite").expanduser()
+DEFAULT_MAX_AGE_SEC = 30 * 24 * 60 * 60
+CACHED_FIELDS = ("topic", "kind", "action", "score", "effort")
+
+
+def cache_key(norm_url: str, model: str) -> str:
+    # Only a digest is stored, so the cache file does not keep a browsing history.
+    return hashlib.sha256(f"{model}\n{norm_url}".encode("utf-8")).hexdigest()
+
+
+class ClassificationCache:
+    """SQLite-backed map of (normalized URL, model) -> classification fields."""
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_CACHE_PATH,
+        *,
+        model: str,
+        max_age_sec: int = DEFAULT_MAX_AGE_SEC,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = Path(path)
+        self.model = model
+        self.max_age_sec = max_age_sec
+        self._clock = clock
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Create the file owner-only before SQLite opens it; SQLite gives its
+        # journal/WAL sidecars the database file's permissions.
+        mode = stat.S_IRUSR | stat.S_IWUSR
+        os.close(os.open(self.path, os.O_RDWR | os.O_CREAT, mode))
+        os.chmod(self.path, mode)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cls (key TEXT PRIMARY KEY, json TEXT NOT NULL, ts INTEGER NOT NULL)"
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def get_many(self, norm_urls: Iterable[str]) -> Dict[str, dict]:
+        keys = {cache_key(url, self.model): url for url in norm_urls}
+        if not keys:
+            return {}
+        oldest = int(self._clock()) - self.max_age_sec
+        found: Dict[str, dict] = {}
+        key_list = list(keys)
+        for start in range(0, len(key_list), 500):
+            batch = key_list[start : start + 500]
+            placeholders = ",".join("?" for _ in batch)
+            rows = self._conn.execute(
+                f"SELECT key, json FROM cls WHERE ts >= ? AND key IN ({placeholders})",
+                [oldest, *batch],
+            )
+            for key, raw in rows:
+                try:
+                    value = json.loads(raw)
+                except Exception:
+                    continue
+                if isinstance(value, dict):
+                    found[keys[key]] = value
+        return found
+
+    def put_many(self, verdicts: Dict[str, dict]) -> None:
+        if not verdicts:
+            return
+        now = int(self._clock())
+        # Expired rows are never read again; drop them while writing so the
+        # file does not keep growing across runs.
+        self._conn.execute("DELETE FROM cls WHERE ts < ?", (now - self.max_age_sec,))
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO cls (key, json, ts) VALUES (?, ?, ?)",
+            [
+                (cache_key(url, self.model), json.dumps(value, sort_keys=True), now)
+                for url, value in verdicts.items()
+            ],
+        )
+        self._conn.commit()
+
+
+def _cacheable(verdict: dict) -> Optional[dict]:
+    kind = verdict.get("kind")
+    if not (isinstance(kind, str) and kind.strip().lower() in POSTPROCESS_KIND_ORDER):
+        return None
+    if normalize_action(verdict.get("action")) is None:
+        return None
+    return {field: verdict[field] for field in CACHED_FIELDS if field in verdict}
+
+
+def with_classification_cache(
+    classify_with_llm_fn: Callable[[List[Tuple[int, Item]], str], Dict[int, dict]],
+    cache: ClassificationCache,
+    *,
+    stderr: Optional[TextIO] = None,
+) -> Callable[[List[Tuple[int, Item]], str], Dict[int, dict]]:
+    """Wrap a classify_with_llm_fn so cached URLs skip the API call.
+
+    Only well-formed verdicts (known kind, recognised action) are stored.
+    Cache failures degrade to the uncached call.
+    """
+
+    def classify(indexed_for_cls, api_key):
+        try:
+            hits = cache.get_many(item.norm_url for _, item in indexed_for_cls)
+        except sqlite3.Error as exc:
+            if stderr is not None:
+                print(f"Classification cache unavailable: {exc}", file=stderr)
+            return classify_with_llm_fn(indexed_for_cls, api_key)
+
+        cls_map: Dict[int, dict] = {}
+        misses: List[Tuple[int, Item]] = []
+        for idx, item in indexed_for_cls:
+            hit = hits.get(item.norm_url)
+            if hit is not None:
+                cls_map[idx] = dict(hit)
+            else:
+                misses.append((idx, item))
+
+        if stderr is not None:
+            print(
+                f"Classification cache: hits={len(indexed_for_cls) - len(misses)} misses={len(misses)}",
+                file=stderr,
+            )
+        if not misses:
+            return cls_map
+
+        fresh = classify_with_llm_fn(misses, api_key)
+        cls_map.update(fresh)
+
+        to_store: Dict[str, dict] = {}
+        for idx, item in misses:
+            verdict = fresh.get(idx)
+            if isinstance(verdict, dict):
+                cacheable = _cacheable(verdict)
+                if cacheable is not None:
+                    to_store[item.norm_url] = cacheable
+        try:
+            cache.put_many(to_store)
+        except sqlite3.Error as exc:
+            if stderr is not None:
+                print(f"Classification cache write failed: {exc}", file=stderr)
+        return cls_map
+
+    return classify
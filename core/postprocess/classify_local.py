@@ -1,9 +1,10 @@
 """Rule-based local tab classification."""
 
 import re
-import urllib.parse
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, Optional
 
+from core.tab_policy.matching import HostBaseSet
 from core.tab_policy.text import slugify_kebab
 
 from .constants import (
@@ -50,11 +51,12 @@ def slugify_topic(value: str) -> str:
     return slugify_kebab(value, fallback="misc")
 
 
+@lru_cache(maxsize=1024)
 def topic_from_host(host: str) -> Optional[str]:
     host = (host or "").strip().lower()
     if not host:
         return None
-    if any(host_matches_base(host, base) for base in SOCIAL_DOMAINS):
+    if _SOCIAL_HOSTS.matches(host):
         return None
 
     host = host.split(":", 1)[0]
@@ -69,28 +71,61 @@ def topic_from_host(host: str) -> Optional[str]:
     return slugify_topic(stem)
 
 
+def _substring_alternation(needles: Iterable[str]) -> Optional[re.Pattern]:
+    """Compile ``any(n in blob for n in needles)`` into one pattern (None if empty)."""
+    needles = list(needles)
+    if not needles:
+        return None
+    return re.compile("|".join(re.escape(needle) for needle in needles))
+
+
+_GO_WORD_RE = re.compile(r"\bgo\b")
+_GO_CONTEXT_RE = _substring_alternation(GO_CONTEXT_HINTS)
+
+
 def needle_in_blob(topic: str, needle: str, blob: str) -> bool:
     if not needle:
         return False
     if topic == "go" and needle == "go":
-        if re.search(r"\bgo\b", blob) is None:
+        if _GO_WORD_RE.search(blob) is None:
             return False
-        return any(hint in blob for hint in GO_CONTEXT_HINTS)
+        return _GO_CONTEXT_RE is not None and _GO_CONTEXT_RE.search(blob) is not None
     return needle in blob
 
 
+# One alternation per topic: TOPIC_KEYWORDS order still decides precedence
+# (a single combined search would prefer the leftmost hit instead), but each
+# topic costs one regex search rather than a Python loop over its needles.
+# The bare "go" needle keeps its word-boundary/context rule from needle_in_blob.
+_TOPIC_KEYWORD_PATTERNS = tuple(
+    (
+        topic,
+        _substring_alternation(n for n in needles if n and not (topic == "go" and n == "go")),
+        topic == "go" and "go" in needles,
+    )
+    for topic, needles in TOPIC_KEYWORDS
+)
+_FALLBACK_TOPIC_PATTERNS = tuple(
+    (topic, pattern)
+    for topic, pattern in (
+        ("ui-ux", _substring_alternation(UI_UX_HINTS)),
+        ("project-management", _substring_alternation(PROJECT_HINTS)),
+        ("research", _substring_alternation(PAPER_HINTS)),
+    )
+    if pattern is not None
+)
+
+
 def topic_from_keywords(text_blob: str) -> Optional[str]:
     blob = (text_blob or "").lower()
-    for topic, needles in TOPIC_KEYWORDS:
-        for needle in needles:
-            if needle_in_blob(topic, needle, blob):
-                return topic
-    if any(hint in blob for hint in UI_UX_HINTS):
-        return "ui-ux"
-    if any(hint in blob for hint in PROJECT_HINTS):
-        return "project-management"
-    if any(hint in blob for hint in PAPER_HINTS):
-        return "research"
+    for topic, pattern, bare_go in _TOPIC_KEYWORD_PATTERNS:
+        if pattern is not None and pattern.search(blob):
+            return topic
+        if bare_go and needle_in_blob(topic, "go", blob):
+            return topic
+    for topic, pattern in _FALLBACK_TOPIC_PATTERNS:
+        if pattern.search(blob):
+            return topic
     return None
 
 
@@ -103,43 +138,80 @@ def _path_matches_hint(path: str, hint: str) -> bool:
     return path == hint or path.startswith(hint + "/")
 
 
-def _blob_matches_hint(blob: str, hint: str) -> bool:
-    if not blob or not hint:
-        return False
+@lru_cache(maxsize=256)
+def _hint_word_pattern(hint: str) -> Optional[re.Pattern]:
+    """Return a token-boundary pattern for word-like hints, None for plain substrings."""
     if re.search(r"[a-z0-9]", hint) and re.fullmatch(r"[a-z0-9-]+", hint):
-        return re.search(rf"(?<![a-z0-9]){re.escape(hint)}(?![a-z0-9])", blob) is not None
-    return hint in blob
+        return re.compile(rf"(?<![a-z0-9]){re.escape(hint)}(?![a-z0-9])")
+    return None
+
+
+def _word_hint_alternation(hints: Iterable[str]) -> re.Pattern:
+    """Compile hints into one pattern: word-like hints match on token
+    boundaries (see ``_hint_word_pattern``), anything else as a substring."""
+    parts = []
+    for hint in hints:
+        if not hint:
+            continue
+        pattern = _hint_word_pattern(hint)
+        parts.append(pattern.pattern if pattern is not None else re.escape(hint))
+    return re.compile("|".join(parts)) if parts else _NEVER_RE
+
+
+def _any_substring(needles: Iterable[str]) -> re.Pattern:
+    return _substring_alternation(needles) or _NEVER_RE
+
+
+# Hint groups checked once per tab, each as a single search instead of a
+# Python-level any() over the hints.
+_NEVER_RE = re.compile(r"(?!)")
+_PAPER_RE = _any_substring(PAPER_HINTS)
+_PROJECT_RE = _any_substring(PROJECT_HINTS)
+_MCP_RE = _any_substring(MCP_HINTS)
+_DEEP_READ_RE = _any_substring(DEEP_READ_HINTS)
+_REFERENCE_RE = _any_substring(REFERENCE_HINTS)
+_UI_UX_RE = _any_substring(UI_UX_HINTS)
+_LOW_SIGNAL_RE = _any_substring(LOW_SIGNAL_HINTS)
+_MUSIC_KEYWORD_RE = _word_hint_alternation(MUSIC_KEYWORD_HINTS)
+_VIDEO_KEYWORD_RE = _word_hint_alternation(VIDEO_KEYWORD_HINTS)
+_REFERENCE_WORD_RE = _word_hint_alternation(REFERENCE_HINTS)
+
+
+# Domain lists matched like host_matches_base, one set probe per list.
+_SOCIAL_HOSTS = HostBaseSet(SOCIAL_DOMAINS)
+_CODE_HOSTS = HostBaseSet(CODE_HOST_DOMAINS)
+_MUSIC_HOSTS = HostBaseSet(MUSIC_HINT_DOMAINS)
+_VIDEO_HOSTS = HostBaseSet(VIDEO_DOMAINS)
+_TOOL_HOSTS = HostBaseSet(TOOL_DOMAINS)
 
 
 def infer_local_kind(item: Item) -> str:
-    url = item.clean_url
-    try:
-        parsed = urllib.parse.urlsplit(url)
-    except Exception:
+    parsed = item.parsed_url
+    if parsed is None:
         return "misc"
 
-    host = (parsed.hostname or "").lower()
+    host = item.host
     path = (parsed.path or "").lower()
     title = (item.title or "").lower()
     blob = f"{host} {path} {title}"
 
-    code_host = any(host_matches_base(host, base) for base in CODE_HOST_DOMAINS)
+    code_host = _CODE_HOSTS.matches(host)
     first_path = ""
     parts = [part for part in path.split("/") if part]
     if parts:
         first_path = parts[0].lower()
 
-    if path.endswith(".pdf") or any(hint in blob for hint in PAPER_HINTS):
+    if path.endswith(".pdf") or _PAPER_RE.search(blob):
         return "paper"
     if any(_path_matches_hint(path, hint) for hint in BLOG_HINTS):
         return "article"
-    if any(host_matches_base(host, base) for base in MUSIC_HINT_DOMAINS):
+    if _MUSIC_HOSTS.matches(host):
         return "music"
-    if any(host_matches_base(host, base) for base in VIDEO_DOMAINS):
+    if _VIDEO_HOSTS.matches(host):
         return "video"
-    if any(_blob_matches_hint(blob, hint) for hint in MUSIC_KEYWORD_HINTS):
+    if _MUSIC_KEYWORD_RE.search(blob):
         return "music"
-    if any(_blob_matches_hint(blob, hint) for hint in VIDEO_KEYWORD_HINTS):
+    if _VIDEO_KEYWORD_RE.search(blob):
         return "video"
     if host_matches_base(host, "huggingface.co") and "/learn/" in path:
         return "docs"
@@ -147,15 +219,15 @@ def infer_local_kind(item: Item) -> str:
         return "docs"
     if code_host and first_path not in CODE_HOST_RESERVED_PATHS:
         return "repo"
-    if any(hint in blob for hint in PROJECT_HINTS):
+    if _PROJECT_RE.search(blob):
         return "tool"
-    if any(hint in blob for hint in MCP_HINTS):
+    if _MCP_RE.search(blob):
         return "tool"
-    if any(host_matches_base(host, base) for base in TOOL_DOMAINS):
+    if _TOOL_HOSTS.matches(host):
         return "tool"
     if host.startswith("docs.") or any(_path_matches_hint(path, hint) for hint in DOC_HINTS):
         return "docs"
-    if any(_blob_matches_hint(blob, hint) for hint in REFERENCE_HINTS):
+    if _REFERENCE_WORD_RE.search(blob):
         return "docs"
     return "article"
 
@@ -172,7 +244,7 @@ def is_action_compatible(kind: str, action: str) -> bool:
 
 
 def infer_local_action(kind: str, item: Item) -> str:
-    lower = f"{item.title} {item.clean_url}".lower()
+    lower = item.text_lower
     if kind in {"video", "music"}:
         return "watch"
     if kind == "repo":
@@ -180,13 +252,13 @@ def infer_local_action(kind: str, item: Item) -> str:
             return "triage"
         return "build"
     if kind == "tool":
-        if any(hint in lower for hint in PROJECT_HINTS):
+        if _PROJECT_RE.search(lower):
             return "build"
         return "triage"
     if kind in {"docs", "paper", "article"}:
-        if kind == "paper" and any(hint in lower for hint in DEEP_READ_HINTS):
+        if kind == "paper" and _DEEP_READ_RE.search(lower):
             return "deep_work"
-        if any(hint in lower for hint in REFERENCE_HINTS):
+        if _REFERENCE_RE.search(lower):
             return "reference"
         return "read"
     return "triage"
@@ -209,19 +281,19 @@ def infer_local_score(kind: str, action: str, item: Item) -> int:
     elif action == "watch":
         score -= 1
 
-    lower = f"{item.title} {item.clean_url}".lower()
-    host = (urllib.parse.urlsplit(item.clean_url).hostname or "").lower()
-    if any(host_matches_base(host, base) for base in SOCIAL_DOMAINS):
+    lower = item.text_lower
+    host = item.host
+    if _SOCIAL_HOSTS.matches(host):
         score -= 1
 
-    deep_read_hit = any(hint in lower for hint in DEEP_READ_HINTS)
+    deep_read_hit = _DEEP_READ_RE.search(lower) is not None
     if deep_read_hit:
         score += 1
-    if any(hint in lower for hint in UI_UX_HINTS):
+    if _UI_UX_RE.search(lower):
         score += 1
-    if any(hint in lower for hint in PROJECT_HINTS):
+    if _PROJECT_RE.search(lower):
         score += 1
-    if any(hint in lower for hint in LOW_SIGNAL_HINTS):
+    if _LOW_SIGNAL_RE.search(lower):
         score -= 1
 
     if kind == "paper" and deep_read_hit:
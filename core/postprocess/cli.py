@@ -11,8 +11,10 @@ Pipeline:
 
 import os
 import sys
+from functools import partial
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 
 def _env_flag(name: str, default: bool = False) -> bool:
@@ -65,6 +67,7 @@ ROOT = _find_root(Path(__file__).resolve())
 if str(ROOT) not in sys.path:
     sys.path.append(str(ROOT))
 
+from core.postprocess.cache import ClassificationCache, with_classification_cache
 from core.postprocess.classify_local import (
     classify_local as _classify_local_impl,
 )
@@ -75,16 +78,25 @@ from core.postprocess.coerce import (
     safe_topic as _safe_topic_impl,
 )
 from core.postprocess.llm import (
+    RequestRateLimiter,
     call_with_retries as _call_with_retries_impl,
     classify_with_llm as _classify_with_llm_impl,
     key_from_keychain as _key_from_keychain_impl,
     openai_chat_json as _openai_chat_json_impl,
+    resolve_tag_model,
 )
 from core.postprocess.models import Item
 from core.postprocess.parsing import (
+    CREATED_SCAN_LINES,
+    FRONTMATTER_SCAN_LINES,
+    created_ts_from_lines,
     extract_created_ts as _extract_created_ts_impl,
     extract_frontmatter_value as _extract_frontmatter_value_impl,
     extract_items as _extract_items_impl,
+    extract_items_from_lines as _extract_items_from_lines_impl,
+    frontmatter_value_from_lines,
+    iter_source_lines,
+    split_head_lines,
 )
 from core.postprocess.pipeline import build_clean_note as _build_clean_note_impl
 from core.postprocess.redaction import (
@@ -96,6 +108,7 @@ from core.postprocess.urls import (
     domain_of,
     is_sensitive_url as _is_sensitive_url_impl,
     normalize_url,
+    sensitive_url_reason as _sensitive_url_reason_impl,
 )
 from core.renderer.renderer import render_markdown  # type: ignore
 
@@ -113,6 +126,12 @@ LLM_ACTION_POLICY = _env_choice(
     default="hybrid",
 )
 MIN_LLM_COVERAGE = _env_float("TABDUMP_MIN_LLM_COVERAGE", 0.7, minimum=0.0, maximum=1.0)
+LOCAL_CLASSIFY_WORKERS = int(_env_float("TABDUMP_LOCAL_CLASSIFY_WORKERS", 0, minimum=0, maximum=32))
+CLASSIFY_PARALLEL = int(_env_float("TABDUMP_CLASSIFY_PARALLEL", 1, minimum=1, maximum=32))
+CLASSIFY_RPM = int(_env_float("TABDUMP_RPM", 0, minimum=0))
+CLASSIFY_TPM = int(_env_float("TABDUMP_TPM", 0, minimum=0))
+CLASSIFY_CACHE_ENABLED = _env_flag("TABDUMP_CACHE", default=False)
+CLASSIFY_MAX_REQUEST_TOKENS = int(_env_float("TABDUMP_CLASSIFY_MAX_TOKENS", 0, minimum=0))
 
 
 def redact_text_for_llm(text: str) -> str:
@@ -123,12 +142,23 @@ def redact_url_for_llm(url: str) -> str:
     return _redact_url_for_llm_impl(url, redact_query=REDACT_QUERY)
 
 
-def extract_items(md: str) -> List[Item]:
-    return _extract_items_impl(md)
+def extract_items(md: Union[str, Iterable[str]]) -> List[Item]:
+    """Parse tab items from note text or from streamed chunks such as an open file."""
+    if isinstance(md, str):
+        return _extract_items_impl(md)
+    return _extract_items_from_lines_impl(iter_source_lines(md))
+
+
+# Each Keychain lookup forks /usr/bin/security, so the answer (including a
+# miss) is remembered for the rest of the process.
+_KEYCHAIN_LOOKUPS: Dict[Tuple[str, str], Optional[str]] = {}
 
 
 def _key_from_keychain() -> Optional[str]:
-    return _key_from_keychain_impl(service=KEYCHAIN_SERVICE, account=KEYCHAIN_ACCOUNT)
+    lookup = (KEYCHAIN_SERVICE, KEYCHAIN_ACCOUNT)
+    if lookup not in _KEYCHAIN_LOOKUPS:
+        _KEYCHAIN_LOOKUPS[lookup] = _key_from_keychain_impl(service=KEYCHAIN_SERVICE, account=KEYCHAIN_ACCOUNT)
+    return _KEYCHAIN_LOOKUPS[lookup]
 
 
 def resolve_openai_api_key() -> Optional[str]:
@@ -184,6 +214,10 @@ def _extract_created_ts(src_path: Path, fallback: str) -> str:
     return _extract_created_ts_impl(src_path, fallback)
 
 
+def _created_ts_from_head(head_lines: List[str], _src_path: Path, fallback: str) -> str:
+    return created_ts_from_lines(head_lines, fallback)
+
+
 def _extract_frontmatter_value(src_path: Path, key: str) -> Optional[str]:
     return _extract_frontmatter_value_impl(src_path, key)
 
@@ -213,19 +247,21 @@ def _default_kind_action(url: str) -> Tuple[str, str]:
     return _default_kind_action_impl(url)
 
 
+def _sensitive_url_reason(url: str) -> Optional[str]:
+    return _sensitive_url_reason_impl(url)
+
+
 def _classify_local(item: Item) -> dict:
     return _classify_local_impl(item)
 
 
 def _classify_with_llm(
     indexed_for_cls: List[Tuple[int, Item]],
-    url_to_idx: Dict[str, int],
     api_key: str,
 ) -> Dict[int, dict]:
     chunk_size = int(os.environ.get("TABDUMP_CLASSIFY_CHUNK", "30"))
     return _classify_with_llm_impl(
         indexed_for_cls=indexed_for_cls,
-        url_to_idx=url_to_idx,
         api_key=api_key,
         max_items=MAX_ITEMS,
         chunk_size=chunk_size,
@@ -233,6 +269,9 @@ def _classify_with_llm(
         redact_text_fn=redact_text_for_llm,
         redact_url_fn=redact_url_for_llm,
         call_with_retries_fn=_call_with_retries,
+        max_request_tokens=CLASSIFY_MAX_REQUEST_TOKENS,
+        parallel=CLASSIFY_PARALLEL,
+        rate_limiter=RequestRateLimiter(CLASSIFY_RPM, CLASSIFY_TPM),
         stderr=sys.stderr,
     )
 
@@ -244,30 +283,80 @@ def _renderer_cfg_override() -> Dict:
     return {"docsOneOffGroupingMode": mode}
 
 
-def build_clean_note(src_path: Path, items: List[Item], dump_id: Optional[str] = None) -> Tuple[str, dict]:
+def _open_classification_cache() -> Optional[ClassificationCache]:
+    if not (CLASSIFY_CACHE_ENABLED and LLM_ENABLED):
+        return None
+    try:
+        return ClassificationCache(model=resolve_tag_model())
+    except Exception as exc:
+        print(f"Classification cache disabled: {exc}", file=sys.stderr)
+        return None
+
+
+def build_clean_note(
+    src_path: Path,
+    items: List[Item],
+    dump_id: Optional[str] = None,
+    head_lines: Optional[List[str]] = None,
+) -> Tuple[str, dict]:
+    """``head_lines`` are the source's first lines as already read by the
+    caller; when given, the created timestamp is taken from them instead of
+    reopening ``src_path``."""
+    cache = _open_classification_cache()
+    classify_with_llm_fn = _classify_with_llm
+    if cache is not None:
+        classify_with_llm_fn = with_classification_cache(_classify_with_llm, cache, stderr=sys.stderr)
+    extract_created_ts_fn = _extract_created_ts
+    if head_lines is not None:
+        created_head = split_head_lines(head_lines, CREATED_SCAN_LINES)
+        extract_created_ts_fn = partial(_created_ts_from_head, created_head)
+    try:
+        return _build_clean_note_with(src_path, items, dump_id, classify_with_llm_fn, extract_created_ts_fn)
+    finally:
+        if cache is not None:
+            cache.close()
+
+
+def _build_clean_note_with(
+    src_path: Path,
+    items: List[Item],
+    dump_id: Optional[str],
+    classify_with_llm_fn,
+    extract_created_ts_fn=_extract_created_ts,
+) -> Tuple[str, dict]:
     return _build_clean_note_impl(
         src_path=src_path,
         items=items,
         dump_id=dump_id,
         llm_enabled=LLM_ENABLED,
         resolve_openai_api_key_fn=resolve_openai_api_key,
-        classify_with_llm_fn=_classify_with_llm,
+        classify_with_llm_fn=classify_with_llm_fn,
         classify_local_fn=_classify_local,
-        is_sensitive_url_fn=_is_sensitive_url,
-        default_kind_action_fn=_default_kind_action,
+        sensitive_url_reason_fn=_sensitive_url_reason,
         safe_topic_fn=_safe_topic,
         safe_kind_fn=_safe_kind,
         safe_action_fn=_safe_action,
         safe_score_fn=_safe_score,
-        extract_created_ts_fn=_extract_created_ts,
+        extract_created_ts_fn=extract_created_ts_fn,
         llm_action_policy=LLM_ACTION_POLICY,
         min_llm_coverage=MIN_LLM_COVERAGE,
+        local_classify_workers=LOCAL_CLASSIFY_WORKERS,
         render_markdown_fn=render_markdown,
         render_cfg_override=_renderer_cfg_override(),
         stderr=sys.stderr,
     )
 
 
+# Characters encoded per write(); keeps the UTF-8 copy of large notes bounded.
+WRITE_CHUNK_CHARS = 1 << 20
+
+
+def _write_text_chunked(path: Path, text: str, chunk_chars: int = WRITE_CHUNK_CHARS) -> None:
+    with path.open("w", encoding="utf-8") as handle:
+        for start in range(0, len(text), chunk_chars):
+            handle.write(text[start : start + chunk_chars])
+
+
 def main(argv: List[str]) -> int:
     if len(argv) < 2:
         exe = Path(argv[0]).name if argv else "cli.py"
@@ -275,20 +364,23 @@ def main(argv: List[str]) -> int:
         return 2
 
     src = Path(argv[1]).expanduser().resolve()
-    md = src.read_text(encoding="utf-8", errors="replace")
-    dump_id = _extract_frontmatter_value(src, "tabdump_id")
-    if not dump_id:
-        print("Missing tabdump_id frontmatter; refusing to postprocess.", file=sys.stderr)
-        return 4
-
-    items = extract_items(md)
+    # Single streamed pass: frontmatter comes from the head lines, and the
+    # same handle then feeds link extraction without re-reading the file.
+    with src.open("r", encoding="utf-8", errors="replace") as handle:
+        head = list(islice(handle, FRONTMATTER_SCAN_LINES))
+        dump_id = frontmatter_value_from_lines(head, "tabdump_id")
+        if not dump_id:
+            print("Missing tabdump_id frontmatter; refusing to postprocess.", file=sys.stderr)
+            return 4
+
+        items = extract_items(chain(head, handle))
     if not items:
         print("No tab items found in the note; nothing to do.", file=sys.stderr)
         return 3
 
-    clean_text, _fm = build_clean_note(src, items, dump_id=dump_id)
+    clean_text, _fm = build_clean_note(src, items, dump_id=dump_id, head_lines=head)
     clean_path = src.with_name(src.stem + " (clean)" + src.suffix)
-    clean_path.write_text(clean_text, encoding="utf-8")
+    _write_text_chunked(clean_path, clean_text)
     print(str(clean_path))
     return 0
 
@@ -1,19 +1,26 @@
 """LLM helpers for tab classification."""
 
+import http.client
 import json
 import os
 import subprocess
+import threading
 import time
 import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, TextIO, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
 
 from core.tab_policy.taxonomy import POSTPROCESS_ACTION_ORDER, POSTPROCESS_KIND_ORDER
 
 from .coerce import normalize_action
 from .models import Item
-from .urls import normalize_url
+
+# Compact separators and raw UTF-8 keep chunked classifier requests small;
+# the encoder is built once instead of per json.dumps call.
+_REQUEST_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
 
 
 def key_from_keychain(service: str, account: str) -> Optional[str]:
@@ -52,6 +59,13 @@ def resolve_openai_api_key(keychain_service: str, keychain_account: str) -> Opti
     return value or None
 
 
+DEFAULT_TAG_MODEL = "gpt-4.1-mini"
+
+
+def resolve_tag_model() -> str:
+    return os.environ.get("TABDUMP_TAG_MODEL") or DEFAULT_TAG_MODEL
+
+
 def _temperature_value() -> Optional[float]:
     raw = os.environ.get("TABDUMP_TAG_TEMPERATURE", "0.2")
     if raw is None:
@@ -62,48 +76,152 @@ def _temperature_value() -> Optional[float]:
     return float(value)
 
 
+class KeepAliveHTTPSClient:
+    """Reuse one HTTPS connection per thread across API calls.
+
+    urllib opens (and TLS-handshakes) a fresh connection per request; chunked
+    classification makes many requests to the same host back to back.
+    Every connection the client opens is tracked, so ``close_all`` can release
+    the ones left behind by worker threads once a pool has shut down.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        *,
+        timeout: float = 120,
+        connection_factory=http.client.HTTPSConnection,
+    ):
+        self.host = host
+        self.timeout = timeout
+        self._connection_factory = connection_factory
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._open = set()
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            with self._lock:
+                if conn not in self._open:
+                    # Closed by close_all() from another thread.
+                    conn = None
+        if conn is None:
+            conn = self._connection_factory(self.host, timeout=self.timeout)
+            with self._lock:
+                self._open.add(conn)
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        """Close the calling thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        self._local.conn = None
+        if conn is not None:
+            with self._lock:
+                self._open.discard(conn)
+            _close_quietly(conn)
+
+    def close_all(self) -> None:
+        """Close every connection opened through this client, on any thread."""
+        with self._lock:
+            conns = list(self._open)
+            self._open.clear()
+        self._local.conn = None
+        for conn in conns:
+            _close_quietly(conn)
+
+    def post(self, path: str, body: bytes, headers: Dict[str, str]) -> Tuple[int, bytes]:
+        for attempt in range(2):
+            conn = self._connection()
+            try:
+                conn.request("POST", path, body=body, headers=headers)
+                resp = conn.getresponse()
+                data = resp.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # The server dropped an idle keep-alive connection; reconnect once.
+                self.close()
+                if attempt:
+                    raise
+                continue
+            except Exception:
+                self.close()
+                raise
+            if resp.will_close:
+                self.close()
+            return resp.status, data
+        raise RuntimeError("unreachable")
+
+
+def _close_quietly(conn) -> None:
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
+OPENAI_HOST = "api.openai.com"
+CHAT_COMPLETIONS_PATH = "/v1/chat/completions"
+_OPENAI_CLIENT = KeepAliveHTTPSClient(OPENAI_HOST)
+
+
+def _http_error_detail(status: int, raw_body: bytes) -> str:
+    detail = f"HTTP {status}"
+    if raw_body:
+        body = raw_body.decode("utf-8", errors="replace")
+        parsed = None
+        try:
+            parsed = json.loads(raw_body)
+        except Exception:
+            parsed = None
+
+        if isinstance(parsed, dict):
+            err = parsed.get("error")
+            if isinstance(err, dict):
+                msg = err.get("message")
+                param = err.get("param")
+                code = err.get("code")
+                parts = [piece for piece in [msg, f"param={param}" if param else None, f"code={code}" if code else None] if piece]
+                detail = " | ".join(parts) if parts else body[:500]
+            else:
+                detail = body[:500]
+        else:
+            detail = body[:500]
+    return detail
+
+
 def _post_chat_completion(payload: dict, api_key: str) -> dict:
+    data = _REQUEST_ENCODER.encode(payload).encode("utf-8")
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+    if urllib.request.getproxies().get("https"):
+        # http.client does not honor proxy settings; keep urllib for those setups.
+        return _post_chat_completion_urllib(data, headers)
+
+    status, body = _OPENAI_CLIENT.post(CHAT_COMPLETIONS_PATH, data, headers)
+    if not 200 <= status < 300:
+        raise RuntimeError(f"OpenAI chat completion failed: {_http_error_detail(status, body)}")
+    return json.loads(body)
+
+
+def _post_chat_completion_urllib(data: bytes, headers: Dict[str, str]) -> dict:
     req = urllib.request.Request(
-        "https://api.openai.com/v1/chat/completions",
-        data=json.dumps(payload).encode("utf-8"),
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-        },
+        f"https://{OPENAI_HOST}{CHAT_COMPLETIONS_PATH}",
+        data=data,
+        headers=headers,
         method="POST",
     )
     try:
         with urllib.request.urlopen(req, timeout=120) as resp:
-            return json.loads(resp.read().decode("utf-8"))
+            return json.loads(resp.read())
     except urllib.error.HTTPError as exc:
-        body = ""
         try:
-            body = exc.read().decode("utf-8", errors="replace")
+            body = exc.read()
         except Exception:
-            body = ""
-
-        detail = f"HTTP {exc.code}"
-        if body:
-            parsed = None
-            try:
-                parsed = json.loads(body)
-            except Exception:
-                parsed = None
-
-            if isinstance(parsed, dict):
-                err = parsed.get("error")
-                if isinstance(err, dict):
-                    msg = err.get("message")
-                    param = err.get("param")
-                    code = err.get("code")
-                    parts = [piece for piece in [msg, f"param={param}" if param else None, f"code={code}" if code else None] if piece]
-                    detail = " | ".join(parts) if parts else body[:500]
-                else:
-                    detail = body[:500]
-            else:
-                detail = body[:500]
-
-        raise RuntimeError(f"OpenAI chat completion failed: {detail}") from exc
+            body = b""
+        raise RuntimeError(f"OpenAI chat completion failed: {_http_error_detail(exc.code, body)}") from exc
 
 
 def openai_chat_json(
@@ -123,7 +241,7 @@ def openai_chat_json(
             "env OPENAI_API_KEY."
         )
 
-    model = model or os.environ.get("TABDUMP_TAG_MODEL") or "gpt-4.1-mini"
+    model = model or resolve_tag_model()
 
     payload = {
         "model": model,
@@ -154,10 +272,16 @@ def openai_chat_json(
         raise RuntimeError(f"OpenAI response is not valid JSON content: {str(content)[:500]}") from exc
 
 
-def chunked(items: List, size: int) -> List[List]:
+def chunked(items: Iterable, size: int) -> Iterator[List]:
     if size <= 0:
-        return [items]
-    return [items[idx : idx + size] for idx in range(0, len(items), size)]
+        yield list(items)
+        return
+    it = iter(items)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
 
 
 def call_with_retries(
@@ -184,9 +308,110 @@ def call_with_retries(
     raise RuntimeError("LLM call failed with unknown error")
 
 
+class RequestRateLimiter:
+    """Space out requests to stay under per-minute request and token caps.
+
+    Each request reserves the next free start slot; the slot advances by the
+    larger of the RPM interval and the request's share of the TPM budget.
+    Thread-safe; non-positive limits disable the matching cap.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        *,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ):
+        self.requests_per_minute = max(0, int(requests_per_minute or 0))
+        self.tokens_per_minute = max(0, int(tokens_per_minute or 0))
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self, tokens: int = 0) -> None:
+        interval = 0.0
+        if self.requests_per_minute > 0:
+            interval = 60.0 / self.requests_per_minute
+        if self.tokens_per_minute > 0 and tokens > 0:
+            interval = max(interval, 60.0 * tokens / self.tokens_per_minute)
+        if interval <= 0:
+            return
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + interval
+        wait = slot - now
+        if wait > 0:
+            self._sleep(wait)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for budgeting (~4 characters per token)."""
+    return (len(text) + 3) // 4
+
+
+def _pack_chunks(
+    chunk_lines: List[Tuple[List[Tuple[int, Item]], List[str]]],
+    max_input_tokens: int,
+) -> List[Tuple[List[Tuple[int, Item]], List[str]]]:
+    """Merge consecutive chunks into one request while they fit the token budget.
+
+    Ids are global, so a packed request is parsed exactly like a single chunk.
+    A non-positive budget leaves chunks as they are.
+    """
+    if max_input_tokens <= 0:
+        return chunk_lines
+    packed: List[Tuple[List[Tuple[int, Item]], List[str]]] = []
+    cur_chunk: List[Tuple[int, Item]] = []
+    cur_lines: List[str] = []
+    cur_tokens = 0
+    for chunk, lines in chunk_lines:
+        tokens = sum(estimate_tokens(line) + 1 for line in lines)
+        if cur_chunk and cur_tokens + tokens > max_input_tokens:
+            packed.append((cur_chunk, cur_lines))
+            cur_chunk, cur_lines, cur_tokens = [], [], 0
+        # The accumulators are always fresh lists, so extending in place never
+        # touches the caller's chunks and keeps packing linear.
+        cur_chunk.extend(chunk)
+        cur_lines.extend(lines)
+        cur_tokens += tokens
+    if cur_chunk:
+        packed.append((cur_chunk, cur_lines))
+    return packed
+
+
+def _classify_user_prompt(lines: List[str], kind_values: str, action_values: str) -> str:
+    return (
+        "For each tab, provide:\n"
+        "- topic: short, lowercase, kebab-case (e.g. distributed-systems, postgres, llm, finance, travel, food, shopping)\n"
+        f"- kind: one of [{kind_values}]\n"
+        f"- action: one of [{action_values}]\n"
+        "- score: integer 1-5 (importance)\n\n"
+        "- effort: one of [quick, medium, deep] (optional)\n\n"
+        "Action rubric (choose enum only; do not use synonyms):\n"
+        "- video/music -> watch\n"
+        "- repo -> triage or build\n"
+        "- tool -> triage or build\n"
+        "- article/docs -> read or reference\n"
+        "- paper -> read, reference, or deep_work\n"
+        "- misc/local/internal/auth -> triage or ignore\n\n"
+        "Return JSON like:\n"
+        "{\n"
+        "  \"items\": [\n"
+        "    {\"id\": 123, \"topic\": \"...\", \"kind\": \"...\", \"action\": \"...\", \"score\": 3, \"effort\": \"medium\"}\n"
+        "  ]\n"
+        "}\n\n"
+        "id is mandatory: use the provided id as-is, do not invent ids, and omit tabs you cannot classify.\n\n"
+        "Do not output action synonyms like listen, browse, or view.\n\n"
+        + "\n".join(lines)
+    )
+
+
 def classify_with_llm(
     indexed_for_cls: List[Tuple[int, Item]],
-    url_to_idx: Dict[str, int],
     api_key: str,
     *,
     max_items: int = 0,
@@ -195,7 +420,9 @@ def classify_with_llm(
     redact_text_fn=None,
     redact_url_fn=None,
     call_with_retries_fn=call_with_retries,
-    normalize_url_fn=normalize_url,
+    max_request_tokens: int = 0,
+    parallel: int = 1,
+    rate_limiter: Optional[RequestRateLimiter] = None,
     stderr: Optional[TextIO] = None,
 ) -> Dict[int, dict]:
     system = "You are a strict classifier for browser tabs. Return ONLY valid JSON."
@@ -212,95 +439,117 @@ def classify_with_llm(
     if redact_url_fn is None:
         redact_url_fn = lambda value: value
 
+    chunk_lines = []
     for chunk in chunked(indexed_for_cls, chunk_size):
         lines = []
         for idx, item in chunk:
             title = redact_text_fn(item.title) if redact_llm else item.title
             url = redact_url_fn(item.clean_url) if redact_llm else item.clean_url
             lines.append(f"- {idx} | {title} | {url} | {item.domain}")
+        chunk_lines.append((chunk, lines))
+    prompts = [
+        (chunk, _classify_user_prompt(lines, kind_values, action_values))
+        for chunk, lines in _pack_chunks(chunk_lines, max_request_tokens)
+    ]
 
-        user = (
-            "For each tab, provide:\n"
-            "- topic: short, lowercase, kebab-case (e.g. distributed-systems, postgres, llm, finance, travel, food, shopping)\n"
-            f"- kind: one of [{kind_values}]\n"
-            f"- action: one of [{action_values}]\n"
-            "- score: integer 1-5 (importance)\n\n"
-            "- effort: one of [quick, medium, deep] (optional)\n\n"
-            "Action rubric (choose enum only; do not use synonyms):\n"
-            "- video/music -> watch\n"
-            "- repo -> triage or build\n"
-            "- tool -> triage or build\n"
-            "- article/docs -> read or reference\n"
-            "- paper -> read, reference, or deep_work\n"
-            "- misc/local/internal/auth -> triage or ignore\n\n"
-            "Return JSON like:\n"
-            "{\n"
-            "  \"items\": [\n"
-            "    {\"id\": 123, \"topic\": \"...\", \"kind\": \"...\", \"action\": \"...\", \"score\": 3, \"effort\": \"medium\"}\n"
-            "  ]\n"
-            "}\n\n"
-            "Use the provided id as-is; do not invent ids.\n\n"
-            "Do not output action synonyms like listen, browse, or view.\n\n"
-            + "\n".join(lines)
-        )
-
-        try:
-            out = call_with_retries_fn(system=system, user=user, api_key=api_key)
-        except Exception as exc:
-            if stderr is not None:
-                print(f"LLM classify failed (chunk size {len(chunk)}): {exc}", file=stderr)
-            out = {"items": []}
-
-        raw_items = out.get("items", [])
-        if not isinstance(raw_items, list):
-            raw_items = []
-
-        chunk_invalid_kind = 0
-        chunk_invalid_action = 0
-        chunk_invalid_item_id = 0
-        chunk_mapped = 0
-
-        for item in raw_items:
-            if not isinstance(item, dict):
-                chunk_invalid_item_id += 1
-                continue
-
-            raw_kind = item.get("kind")
-            if not (isinstance(raw_kind, str) and raw_kind.strip().lower() in allowed_kinds):
-                chunk_invalid_kind += 1
-
-            if normalize_action(item.get("action")) is None:
-                chunk_invalid_action += 1
-
-            idx_raw = item.get("id")
-            idx: Optional[int] = None
-            if idx_raw is not None:
-                try:
-                    idx = int(idx_raw)
-                except Exception:
-                    idx = None
-
-            if idx is None:
-                url = item.get("url")
-                if url:
-                    idx = url_to_idx.get(normalize_url_fn(str(url)))
+    def request_chunk(user: str) -> dict:
+        if rate_limiter is not None:
+            rate_limiter.acquire(estimate_tokens(system) + estimate_tokens(user))
+        return call_with_retries_fn(system=system, user=user, api_key=api_key)
+
+    # Chunks are independent HTTP round-trips, so they can overlap; results
+    # are still merged in chunk order to keep diagnostics deterministic
+    # (every chunk has to finish anyway, so completion order saves nothing).
+    # A single request, the common case for small dumps, skips the pool.
+    workers = min(parallel, len(prompts))
+    if workers > 1:
+        pool = ThreadPoolExecutor(max_workers=workers)
+        pending = [pool.submit(request_chunk, user) for _, user in prompts]
+    else:
+        pool = None
+        pending = [None] * len(prompts)
 
-            if idx is None:
-                chunk_invalid_item_id += 1
-                continue
-            cls_map[idx] = item
-            chunk_mapped += 1
-
-        if stderr is not None:
-            print(
-                "LLM classify chunk diagnostics: "
-                f"input={len(chunk)} "
-                f"response_items={len(raw_items)} "
-                f"mapped={chunk_mapped} "
-                f"invalid_kind={chunk_invalid_kind} "
-                f"invalid_action={chunk_invalid_action} "
-                f"invalid_item_id={chunk_invalid_item_id}",
-                file=stderr,
+    try:
+        for (chunk, user), future in zip(prompts, pending):
+            try:
+                out = future.result() if future is not None else request_chunk(user)
+            except Exception as exc:
+                if stderr is not None:
+                    print(f"LLM classify failed (chunk size {len(chunk)}): {exc}", file=stderr)
+                out = {"items": []}
+            _merge_chunk_response(
+                out,
+                chunk,
+                cls_map,
+                allowed_kinds=allowed_kinds,
+                stderr=stderr,
             )
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True)
+        # All requests are done (worker threads included); release the
+        # keep-alive sockets so none outlive the run.
+        _OPENAI_CLIENT.close_all()
 
     return cls_map
+
+
+def _merge_chunk_response(
+    out: dict,
+    chunk: List[Tuple[int, Item]],
+    cls_map: Dict[int, dict],
+    *,
+    allowed_kinds: set,
+    stderr: Optional[TextIO],
+) -> None:
+    # Responses map back by the prompt id only, and only onto tabs sent in
+    # this chunk; items without a usable id are counted and dropped.
+    chunk_ids = {idx for idx, _ in chunk}
+
+    raw_items = out.get("items", [])
+    if not isinstance(raw_items, list):
+        raw_items = []
+
+    chunk_invalid_kind = 0
+    chunk_invalid_action = 0
+    chunk_invalid_item_id = 0
+    chunk_mapped = 0
+
+    for item in raw_items:
+        if not isinstance(item, dict):
+            chunk_invalid_item_id += 1
+            continue
+
+        raw_kind = item.get("kind")
+        if not (isinstance(raw_kind, str) and raw_kind.strip().lower() in allowed_kinds):
+            chunk_invalid_kind += 1
+
+        if normalize_action(item.get("action")) is None:
+            chunk_invalid_action += 1
+
+        idx_raw = item.get("id")
+        idx: Optional[int] = None
+        if type(idx_raw) is int:
+            idx = idx_raw
+        elif idx_raw is not None:
+            try:
+                idx = int(idx_raw)
+            except Exception:
+                idx = None
+        if idx is None or idx not in chunk_ids:
+            chunk_invalid_item_id += 1
+            continue
+        cls_map[idx] = item
+        chunk_mapped += 1
+
+    if stderr is not None:
+        print(
+            "LLM classify chunk diagnostics: "
+            f"input={len(chunk)} "
+            f"response_items={len(raw_items)} "
+            f"mapped={chunk_mapped} "
+            f"invalid_kind={chunk_invalid_kind} "
+            f"invalid_action={chunk_invalid_action} "
+            f"invalid_item_id={chunk_invalid_item_id}",
+            file=stderr,
+        )
@@ -1,14 +1,67 @@
 """Data models for tab post-processing."""
 
+import urllib.parse
 from dataclasses import dataclass
 from typing import Optional
 
+from .urls import split_url
+
 
 @dataclass
 class Item:
+    # Explicit __slots__ (dataclass(slots=True) needs Python 3.10) keep each
+    # tab free of a per-instance __dict__. The underscored slots back the
+    # lazily derived URL views below.
+    __slots__ = (
+        "title",
+        "url",
+        "norm_url",
+        "clean_url",
+        "domain",
+        "browser",
+        "_parsed_url",
+        "_host",
+        "_text_lower",
+    )
+
     title: str
     url: str
     norm_url: str
     clean_url: str
     domain: str
     browser: Optional[str]
+
+    # Derived views used by several local heuristics; computed on first use
+    # so each item is split and lowercased once. Items are not mutated after
+    # extraction, so the cached values never go stale.
+    @property
+    def parsed_url(self) -> Optional[urllib.parse.SplitResult]:
+        try:
+            return self._parsed_url
+        except AttributeError:
+            pass
+        try:
+            parsed = split_url(self.clean_url)
+        except ValueError:
+            parsed = None
+        self._parsed_url = parsed
+        return parsed
+
+    @property
+    def host(self) -> str:
+        try:
+            return self._host
+        except AttributeError:
+            pass
+        parsed = self.parsed_url
+        self._host = (parsed.hostname or "").lower() if parsed is not None else ""
+        return self._host
+
+    @property
+    def text_lower(self) -> str:
+        try:
+            return self._text_lower
+        except AttributeError:
+            pass
+        self._text_lower = f"{self.title} {self.clean_url}".lower()
+        return self._text_lower
@@ -1,18 +1,65 @@
 """Markdown and frontmatter parsing helpers."""
 
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, List, Optional, Tuple
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 
 from .models import Item
 from .urls import domain_of, normalize_url
 
+CREATED_SCAN_LINES = 30
+FRONTMATTER_SCAN_LINES = 80
+CREATED_RE = re.compile(r'^created:\s*"?(.+?)"?$')
+BROWSER_HEADINGS = (
+    ("## Chrome", "chrome"),
+    ("## Safari", "safari"),
+    ("## Firefox", "firefox"),
+)
+# "- [title](url)" with backslash escapes but no nested brackets/parens.
+SIMPLE_LINK_RE = re.compile(r"- \[((?:[^\[\]\\]|\\.)*)\]\s*\(((?:[^()\\]|\\.)*)\)", re.DOTALL)
+_LINK_ESCAPE_RE = re.compile(r"\\(.)", re.DOTALL)
+
 
 def parse_markdown_link_line(line: str) -> Optional[Tuple[str, str]]:
     stripped = line.strip()
     if not stripped.startswith("- ["):
         return None
 
+    # Fast path: no escapes and no nested brackets/parens, which is nearly
+    # every exported tab. Locating the delimiters with str.find is several
+    # times cheaper than the regex below.
+    if "\\" not in stripped:
+        close = stripped.find("]", 3)
+        if close > 0 and "[" not in stripped[3:close]:
+            rest = stripped[close + 1 :].lstrip()
+            if len(rest) >= 2 and rest[0] == "(" and rest[-1] == ")":
+                url = rest[1:-1]
+                if "(" not in url and ")" not in url:
+                    title = stripped[3:close].strip()
+                    url = url.strip()
+                    if not title or not url:
+                        return None
+                    return title, url
+
+    # Escapes, or no match above: the regex handles escapes without nesting;
+    # anything else goes through the full scanner below.
+    match = SIMPLE_LINK_RE.fullmatch(stripped)
+    if match is not None:
+        title, url = match.groups()
+        if "\\" in title:
+            title = _LINK_ESCAPE_RE.sub(r"\1", title)
+        if "\\" in url:
+            url = _LINK_ESCAPE_RE.sub(r"\1", url)
+        title = title.strip()
+        url = url.strip()
+        if not title or not url:
+            return None
+        return title, url
+    return _parse_markdown_link_scan(stripped)
+
+
+def _parse_markdown_link_scan(stripped: str) -> Optional[Tuple[str, str]]:
     idx = 2
     if idx >= len(stripped) or stripped[idx] != "[":
         return None
@@ -99,24 +146,46 @@ def parse_markdown_link_line(line: str) -> Optional[Tuple[str, str]]:
     return title, url
 
 
+def iter_source_lines(chunks: Iterable[str]) -> Iterator[str]:
+    """Yield lines from streamed text (e.g. an open file) like ``str.splitlines``."""
+    for chunk in chunks:
+        yield from chunk.splitlines()
+
+
 def extract_items(
     markdown: str,
     *,
     normalize_url_fn: Callable[[str], str] = normalize_url,
     domain_of_fn: Callable[[str], str] = domain_of,
+) -> List[Item]:
+    return extract_items_from_lines(
+        markdown.splitlines(),
+        normalize_url_fn=normalize_url_fn,
+        domain_of_fn=domain_of_fn,
+    )
+
+
+def extract_items_from_lines(
+    lines: Iterable[str],
+    *,
+    normalize_url_fn: Callable[[str], str] = normalize_url,
+    domain_of_fn: Callable[[str], str] = domain_of,
 ) -> List[Item]:
     items: List[Item] = []
     current_browser: Optional[str] = None
 
-    for line in markdown.splitlines():
-        if line.startswith("## "):
-            if line.startswith("## Chrome"):
-                current_browser = "chrome"
-            elif line.startswith("## Safari"):
-                current_browser = "safari"
-            elif line.startswith("## Firefox"):
-                current_browser = "firefox"
-        if line.startswith("### "):
+    for line in lines:
+        # Dispatch on the first character: headings start with "#", and a
+        # link line can only start with "-" or indentation.
+        head = line[:1]
+        if head == "#":
+            if line.startswith("## "):
+                for prefix, browser in BROWSER_HEADINGS:
+                    if line.startswith(prefix):
+                        current_browser = browser
+                        break
+            continue
+        if head != "-" and not head.isspace():
             continue
 
         parsed = parse_markdown_link_line(line)
@@ -139,29 +208,58 @@ def extract_items(
     return items
 
 
+def read_head_lines(src_path: Path, limit: int) -> List[str]:
+    """Return ``read_text().splitlines()[:limit]`` without reading the whole file."""
+    with src_path.open("r", encoding="utf-8", errors="replace") as handle:
+        return split_head_lines(handle, limit)
+
+
+def split_head_lines(raw_lines: Iterable[str], limit: int) -> List[str]:
+    """Return the first ``limit`` lines of ``"".join(raw_lines).splitlines()``."""
+    head: List[str] = []
+    for line in raw_lines:
+        # Re-split so separators other than newlines break lines exactly
+        # as str.splitlines() does on the full text.
+        head.extend(line.splitlines())
+        if len(head) >= limit:
+            break
+    return head[:limit]
+
+
 def extract_created_ts(src_path: Path, fallback: str) -> str:
     try:
-        head = src_path.read_text(encoding="utf-8", errors="replace").splitlines()[:30]
+        head = read_head_lines(src_path, CREATED_SCAN_LINES)
     except Exception:
         return fallback
+    return created_ts_from_lines(head, fallback)
+
 
+def created_ts_from_lines(head: Iterable[str], fallback: str) -> str:
     for line in head:
-        match = re.match(r'^created:\s*"?(.+?)"?$', line.strip())
+        match = CREATED_RE.match(line.strip())
         if match:
             return match.group(1)
     return fallback
 
 
+@lru_cache(maxsize=32)
+def _frontmatter_pattern(key: str) -> re.Pattern:
+    return re.compile(rf"^{re.escape(key)}:\s*\"?(.+?)\"?\s*$")
+
+
 def extract_frontmatter_value(src_path: Path, key: str) -> Optional[str]:
     try:
-        head = src_path.read_text(encoding="utf-8", errors="replace").splitlines()[:80]
+        head = read_head_lines(src_path, FRONTMATTER_SCAN_LINES)
     except Exception:
         return None
+    return frontmatter_value_from_lines(head, key)
+
 
+def frontmatter_value_from_lines(head: List[str], key: str) -> Optional[str]:
     if not head or head[0].strip() != "---":
         return None
 
-    pattern = re.compile(rf"^{re.escape(key)}:\s*\"?(.+?)\"?\s*$")
+    pattern = _frontmatter_pattern(key)
     for line in head[1:]:
         if line.strip() == "---":
             break
@@ -4,6 +4,8 @@ import os
 import sys
 import time
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Tuple
 
@@ -18,9 +20,15 @@ from .classify_local import (
 from .coerce import normalize_action, safe_action, safe_effort, safe_kind, safe_score, safe_topic
 from .models import Item
 from .parsing import extract_created_ts
-from .urls import default_kind_action, is_sensitive_url
+from .urls import default_kind_action, is_sensitive_url, kind_action_for_reason, sensitive_url_reason
 
 ACTION_POLICIES = {"raw", "derived", "hybrid"}
+# Below this many items, process pool startup costs more than it saves.
+LOCAL_CLASSIFY_POOL_MIN_ITEMS = 200
+# Shared by every enriched item; the renderer only reads flags and builds its
+# own normalized copy, so one instance is enough.
+_EMPTY_FLAGS: Dict[str, bool] = {}
+
 
 def _env_flag(name: str, default: bool = False) -> bool:
     value = os.environ.get(name)
@@ -29,6 +37,11 @@ def _env_flag(name: str, default: bool = False) -> bool:
     return value.strip().lower() in {"1", "true", "yes", "on", "y"}
 
 
+@lru_cache(maxsize=1024)
+def _topic_title(slug: str) -> str:
+    return slug.replace("-", " ").title()
+
+
 def _normalize_action_policy(value: str) -> str:
     candidate = str(value or "").strip().lower()
     if candidate in ACTION_POLICIES:
@@ -73,6 +86,26 @@ def _resolve_llm_action(
     return safe_action_fn(derived)
 
 
+def _classify_local_batch(
+    items: List[Item],
+    classify_local_fn: Callable[[Item], dict],
+    *,
+    workers: int,
+    stderr,
+) -> List[dict]:
+    if workers > 1 and len(items) >= LOCAL_CLASSIFY_POOL_MIN_ITEMS:
+        chunksize = max(1, len(items) // (workers * 4))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(classify_local_fn, items, chunksize=chunksize))
+        except Exception as exc:
+            print(
+                f"Local classify pool unavailable ({type(exc).__name__}); running serially.",
+                file=stderr,
+            )
+    return [classify_local_fn(item) for item in items]
+
+
 def build_clean_note(
     src_path: Path,
     items: List[Item],
@@ -80,10 +113,11 @@ def build_clean_note(
     *,
     llm_enabled: bool,
     resolve_openai_api_key_fn: Callable[[], Optional[str]],
-    classify_with_llm_fn: Callable[[List[Tuple[int, Item]], Dict[str, int], str], Dict[int, dict]],
+    classify_with_llm_fn: Callable[[List[Tuple[int, Item]], str], Dict[int, dict]],
     classify_local_fn: Callable[[Item], dict] = classify_local,
     is_sensitive_url_fn: Callable[[str], bool] = is_sensitive_url,
     default_kind_action_fn: Callable[[str], Tuple[str, str]] = default_kind_action,
+    sensitive_url_reason_fn: Callable[[str], Optional[str]] = sensitive_url_reason,
     safe_topic_fn: Callable[[object, str], str] = safe_topic,
     safe_kind_fn: Callable[[object], str] = safe_kind,
     safe_action_fn: Callable[[object], str] = safe_action,
@@ -95,19 +129,50 @@ def build_clean_note(
     extract_created_ts_fn: Callable[[Path, str], str] = extract_created_ts,
     llm_action_policy: str = "hybrid",
     min_llm_coverage: float = 0.7,
+    local_classify_workers: int = 0,
     render_markdown_fn=render_markdown,
     render_cfg_override: Optional[dict] = None,
     stderr=sys.stderr,
 ) -> Tuple[str, dict]:
     indexed_items = list(enumerate(items))
-    url_to_idx = {item.norm_url: idx for idx, item in indexed_items}
     effort_debug_enabled = _env_flag("TABDUMP_EFFORT_DEBUG", default=False)
     effort_band_counts: Counter[str] = Counter()
     effort_signal_counts: Counter[str] = Counter()
-    sensitive_items: Dict[int, bool] = {
-        idx: is_sensitive_url_fn(item.clean_url) for idx, item in indexed_items
-    }
-    indexed_for_cls = [(idx, item) for idx, item in indexed_items if not sensitive_items[idx]]
+    # One pass records each item's sensitivity and builds the classification
+    # lists.
+    # - A sensitive item keeps the reason it was flagged, so its kind/action
+    #   comes from kind_action_for_reason without parsing the URL again.
+    #   Overriding is_sensitive_url_fn or default_kind_action_fn switches
+    #   back to asking those hooks per URL.
+    # - Repeated tabs share one classification request; results are fanned
+    #   back out to duplicates after the LLM call. Items without a URL carry
+    #   nothing worth prompting for and fall through to local/default
+    #   classification.
+    kind_action_from_reason = is_sensitive_url_fn is is_sensitive_url and default_kind_action_fn is default_kind_action
+    first_idx_by_url: Dict[str, int] = {}
+    sensitive_items: Dict[int, Optional[str]] = {}
+    indexed_for_cls: List[Tuple[int, Item]] = []
+    unique_for_cls: List[Tuple[int, Item]] = []
+    for idx, item in indexed_items:
+        first_idx = first_idx_by_url.setdefault(item.norm_url, idx)
+        if is_sensitive_url_fn is is_sensitive_url:
+            reason = sensitive_url_reason_fn(item.clean_url)
+        else:
+            reason = "sensitive" if is_sensitive_url_fn(item.clean_url) else None
+        sensitive_items[idx] = reason
+        if reason:
+            continue
+        indexed_for_cls.append((idx, item))
+        if item.norm_url and first_idx == idx:
+            unique_for_cls.append((idx, item))
+    if kind_action_from_reason:
+        sensitive_kind_action = {
+            idx: kind_action_for_reason(reason) for idx, reason in sensitive_items.items() if reason
+        }
+    else:
+        sensitive_kind_action = {
+            idx: default_kind_action_fn(item.clean_url) for idx, item in indexed_items if sensitive_items[idx]
+        }
 
     cls_map: Dict[int, dict] = {}
     use_llm = llm_enabled
@@ -120,7 +185,13 @@ def build_clean_note(
                 file=stderr,
             )
         else:
-            cls_map = classify_with_llm_fn(indexed_for_cls, url_to_idx, api_key)
+            cls_map = classify_with_llm_fn(unique_for_cls, api_key)
+            if len(unique_for_cls) < len(indexed_for_cls):
+                for idx, item in indexed_for_cls:
+                    if idx not in cls_map:
+                        shared = cls_map.get(first_idx_by_url[item.norm_url])
+                        if shared is not None:
+                            cls_map[idx] = shared
 
     non_sensitive_total = len(indexed_for_cls)
     mapped_non_sensitive = 0
@@ -143,12 +214,35 @@ def build_clean_note(
     }
     action_policy = _normalize_action_policy(llm_action_policy)
 
+    local_cls_map: Dict[int, dict] = {}
+    if use_local_classifier or fallback_unmapped_to_local:
+        local_targets = [(idx, item) for idx, item in indexed_for_cls if not cls_map.get(idx)]
+        # Like LLM verdicts, a repeated URL reuses its first occurrence's local
+        # verdict; the renderer keeps only that first occurrence anyway.
+        first_local_idx: Dict[str, int] = {}
+        unique_local: List[Tuple[int, Item]] = []
+        for idx, item in local_targets:
+            if item.norm_url not in first_local_idx:
+                first_local_idx[item.norm_url] = idx
+                unique_local.append((idx, item))
+        local_results = _classify_local_batch(
+            [item for _, item in unique_local],
+            classify_local_fn,
+            workers=local_classify_workers,
+            stderr=stderr,
+        )
+        unique_results = {idx: result for (idx, _), result in zip(unique_local, local_results)}
+        local_cls_map = {
+            idx: unique_results[first_local_idx[item.norm_url]] for idx, item in local_targets
+        }
+
     enriched: List[dict] = []
+    topic_entries: Dict[str, List[dict]] = {}
 
     for idx, item in indexed_items:
         cls = cls_map.get(idx, {})
-        if sensitive_items.get(idx):
-            kind, action = default_kind_action_fn(item.clean_url)
+        if idx in sensitive_kind_action:
+            kind, action = sensitive_kind_action[idx]
             topic = safe_topic_fn(None, item.domain)
             score = 3
             effort_input = None
@@ -170,7 +264,7 @@ def build_clean_note(
         elif use_local_classifier or fallback_unmapped_to_local:
             if use_llm:
                 diagnostics["llm_fallback_local"] += 1
-            local = classify_local_fn(item)
+            local = local_cls_map[idx]
             topic = safe_topic_fn(local.get("topic"), item.domain)
             kind = safe_kind_fn(local.get("kind"))
             action = safe_action_fn(local.get("action"))
@@ -201,6 +295,17 @@ def build_clean_note(
                     continue
                 effort_signal_counts[reason] += 1
 
+        # Items with the same topic share one read-only topics list, like flags.
+        topics = topic_entries.get(topic)
+        if topics is None:
+            topics = topic_entries[topic] = [
+                {
+                    "slug": topic,
+                    "title": _topic_title(topic),
+                    "confidence": 0.8,
+                }
+            ]
+
         enriched.append(
             {
                 "title": item.title,
@@ -209,18 +314,12 @@ def build_clean_note(
                 "browser": item.browser,
                 "kind": kind,
                 "effort": effort,
-                "topics": [
-                    {
-                        "slug": topic,
-                        "title": topic.replace("-", " ").title(),
-                        "confidence": 0.8,
-                    }
-                ],
+                "topics": topics,
                 "intent": {
                     "action": action,
                     "confidence": (score or 3) / 5,
                 },
-                "flags": {},
+                "flags": _EMPTY_FLAGS,
             }
         )
 
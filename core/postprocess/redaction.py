@@ -2,29 +2,41 @@
 
 import re
 import urllib.parse
+from functools import lru_cache
+
+from .urls import URL_CACHE_SIZE, query_keys, split_url
 
 CONTROL_CHARS_RE = re.compile(r"[\x00-\x1f\x7f]")
 SENSITIVE_KV_RE = re.compile(
     r"(?i)\b(token|secret|api[-_]?key|auth|session|password|passwd|code|sig|signature)\s*[:=]\s*([^\s&]+)"
 )
 
+# Same pattern without Unicode tables. Once control characters are stripped,
+# ASCII text matches identically under both (\s, \b and case folding only
+# differ on non-ASCII or \x1c-\x1f input), and this one runs ~2x faster.
+_SENSITIVE_KV_ASCII_RE = re.compile(SENSITIVE_KV_RE.pattern, re.ASCII)
+
 
+@lru_cache(maxsize=URL_CACHE_SIZE)
 def strip_control_chars(value: str) -> str:
     return CONTROL_CHARS_RE.sub("", value)
 
 
+@lru_cache(maxsize=URL_CACHE_SIZE)
 def redact_text_for_llm(text: str, max_title: int = 0) -> str:
     text = strip_control_chars(text)
-    text = SENSITIVE_KV_RE.sub(lambda match: f"{match.group(1)}=[REDACTED]", text)
+    pattern = _SENSITIVE_KV_ASCII_RE if text.isascii() else SENSITIVE_KV_RE
+    text = pattern.sub(lambda match: f"{match.group(1)}=[REDACTED]", text)
     if max_title > 0 and len(text) > max_title:
         text = text[:max_title] + "..."
     return text
 
 
+@lru_cache(maxsize=URL_CACHE_SIZE)
 def redact_url_for_llm(url: str, redact_query: bool = True) -> str:
     url = url.strip()
     try:
-        parsed = urllib.parse.urlsplit(url)
+        parsed = split_url(url)
     except Exception:
         return url
 
@@ -40,9 +52,17 @@ def redact_url_for_llm(url: str, redact_query: bool = True) -> str:
     query = ""
     if parsed.query:
         if redact_query:
-            keys = [key for key, _ in urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)]
-            query = urllib.parse.urlencode([(key, "REDACTED") for key in keys], doseq=True)
+            query = urllib.parse.urlencode(
+                [(key, "REDACTED") for key in query_keys(parsed.query)],
+                doseq=True,
+            )
         else:
             query = parsed.query
 
     return urllib.parse.urlunsplit((scheme, netloc, path, query, ""))
+
+
+def clear_caches() -> None:
+    strip_control_chars.cache_clear()
+    redact_text_for_llm.cache_clear()
+    redact_url_for_llm.cache_clear()
@@ -1,33 +1,93 @@
 """URL utilities and sensitivity checks."""
 
 import ipaddress
+import re
 import urllib.parse
-from typing import Iterable, Tuple
+from functools import lru_cache
+from typing import FrozenSet, Iterable, Optional, Pattern, Tuple
 
 from core.tab_policy.matching import host_matches_base as _host_matches_base_shared
+from core.tab_policy.matching import query_keys
 
 from .constants import AUTH_PATH_HINTS, SENSITIVE_HOSTS, SENSITIVE_QUERY_KEYS, TRACKING_PARAMS
 
+# URL helpers are pure, and the same URLs recur across tabs and re-runs.
+URL_CACHE_SIZE = 16384
 
+# Plain http(s) URLs made only of unreserved/sub-delim ASCII (no IPv6 brackets,
+# whitespace or controls), for which urlsplit is a straight split on "/?#".
+_URL_SAFE_CHARS = r"A-Za-z0-9\-._~%!$&'()*+,;=:@"
+SIMPLE_HTTP_URL_RE = re.compile(
+    rf"(?i:(https?))://([{_URL_SAFE_CHARS}]+)(/[{_URL_SAFE_CHARS}/]*)?"
+    rf"(?:\?([{_URL_SAFE_CHARS}/?]*))?(?:#[{_URL_SAFE_CHARS}/?#]*)?"
+)
+
+
+_TRACKING_PARAMS = frozenset(TRACKING_PARAMS)
+
+# A query of "key=value" pairs in unreserved characters survives
+# parse_qsl/urlencode unchanged, so if it is also sorted and free of tracking
+# keys it is already in normalized form.
+_PLAIN_QUERY_RE = re.compile(r"[A-Za-z0-9._~-]+=[A-Za-z0-9._~-]*(?:&[A-Za-z0-9._~-]+=[A-Za-z0-9._~-]*)*")
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def split_url(url: str) -> urllib.parse.SplitResult:
+    """Memoized ``urllib.parse.urlsplit``.
+
+    The clean URL of every tab is split for its domain, its sensitivity check,
+    local classification and redaction; SplitResult is immutable, so one
+    parse can be shared by all of them.
+    """
+    return urllib.parse.urlsplit(url)
+
+
+def _is_tracking_param(key_lower: str) -> bool:
+    return key_lower.startswith("utm_") or key_lower in _TRACKING_PARAMS
+
+
+def _is_canonical_query(query: str) -> bool:
+    if _PLAIN_QUERY_RE.fullmatch(query) is None:
+        return False
+    pairs = [tuple(field.split("=", 1)) for field in query.split("&")]
+    for key, _ in pairs:
+        if _is_tracking_param(key.lower()):
+            return False
+    return all(pairs[i] <= pairs[i + 1] for i in range(len(pairs) - 1))
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
 def normalize_url(url: str) -> str:
     url = url.strip()
+    fast = SIMPLE_HTTP_URL_RE.fullmatch(url)
+    if fast is not None and not fast.group(4):
+        # No query to filter or sort: skip the urlsplit/urlunsplit round-trip.
+        path = fast.group(3) or "/"
+        if path != "/" and path.endswith("/"):
+            path = path[:-1]
+        return f"{fast.group(1).lower()}://{fast.group(2).lower()}{path}"
+
     try:
-        parsed = urllib.parse.urlsplit(url)
+        parsed = split_url(url)
     except Exception:
         return url
 
     if not parsed.netloc:
         return url
 
-    query_items = urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)
-    filtered = []
-    for key, value in query_items:
-        key_lower = key.lower()
-        if key_lower.startswith("utm_") or key_lower in TRACKING_PARAMS:
-            continue
-        filtered.append((key, value))
-    filtered.sort(key=lambda kv: (kv[0], kv[1]))
-    query = urllib.parse.urlencode(filtered, doseq=True)
+    query = ""
+    if parsed.query and _is_canonical_query(parsed.query):
+        query = parsed.query
+    elif parsed.query:
+        filtered = [
+            (key, value)
+            for key, value in urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)
+            if not _is_tracking_param(key.lower())
+        ]
+        if len(filtered) > 1:
+            filtered.sort()
+        if filtered:
+            query = urllib.parse.urlencode(filtered, doseq=True)
 
     scheme = (parsed.scheme or "https").lower()
     netloc = parsed.netloc.lower()
@@ -39,9 +99,10 @@ def normalize_url(url: str) -> str:
     return urllib.parse.urlunsplit((scheme, netloc, path, query, ""))
 
 
+@lru_cache(maxsize=URL_CACHE_SIZE)
 def domain_of(url: str) -> str:
     try:
-        parsed = urllib.parse.urlsplit(url)
+        parsed = split_url(url)
         return (parsed.netloc or "").lower() or "(unknown)"
     except Exception:
         return "(unknown)"
@@ -51,12 +112,18 @@ def host_matches_base(host: str, base: str) -> bool:
     return _host_matches_base_shared(host, base, enable_suffix=True, strip_www_host=False)
 
 
+_IPV4_CHARS_RE = re.compile(r"[0-9.]+")
+
+
 def is_private_or_loopback_host(host: str) -> bool:
     host = host.strip().lower()
     if host in {"localhost", "127.0.0.1", "::1"}:
         return True
     if host.endswith(".local"):
         return True
+    if ":" not in host and _IPV4_CHARS_RE.fullmatch(host) is None:
+        # Neither IPv6 nor dotted IPv4, so ip_address() would only raise.
+        return False
     try:
         ip = ipaddress.ip_address(host)
     except ValueError:
@@ -70,55 +137,181 @@ def matches_sensitive_host_or_path(
     sensitive_hosts: Iterable[str] = SENSITIVE_HOSTS,
 ) -> bool:
     host = (host or "").strip().lower()
+    if not host:
+        return False
     path = (path or "").strip().lower()
-    for marker in sensitive_hosts:
-        needle = str(marker).strip().lower()
+    exact, suffixes, path_markers = _sensitive_host_markers(tuple(str(marker) for marker in sensitive_hosts))
+    if host in exact or host.endswith(suffixes):
+        return True
+    for marker_host, marker_path in path_markers:
+        if (host == marker_host or host.endswith("." + marker_host)) and path.startswith(marker_path):
+            return True
+    return False
+
+
+@lru_cache(maxsize=8)
+def _sensitive_host_markers(
+    markers: Tuple[str, ...],
+) -> Tuple[FrozenSet[str], Tuple[str, ...], Tuple[Tuple[str, str], ...]]:
+    """Split markers into bare hosts (matched like ``host_matches_base`` via a
+    set and an ``endswith`` tuple) and ``host/path`` prefixes."""
+    hosts = set()
+    path_markers = []
+    for marker in markers:
+        needle = marker.strip().lower()
         if not needle:
             continue
         if "/" in needle:
             marker_host, marker_path = needle.split("/", 1)
-            marker_path = "/" + marker_path
-            if host_matches_base(host, marker_host) and path.startswith(marker_path):
-                return True
+            marker_host = marker_host.strip()
+            if marker_host:
+                path_markers.append((marker_host, "/" + marker_path))
             continue
-        if host_matches_base(host, needle):
-            return True
-    return False
+        hosts.add(needle)
+    exact = frozenset(hosts)
+    return exact, tuple("." + host for host in exact), tuple(path_markers)
 
 
-def is_sensitive_url(
+SENSITIVE_REASON_KIND_ACTION = {
+    "unparseable": ("internal", "ignore"),
+    "file_scheme": ("local", "ignore"),
+    "missing_host": ("internal", "ignore"),
+    "private_host": ("local", "ignore"),
+    "auth_path_hint": ("auth", "ignore"),
+    "sensitive_host_match": ("auth", "ignore"),
+    "sensitive_query_key": ("auth", "ignore"),
+    "non_http_scheme": ("internal", "ignore"),
+}
+
+
+def sensitive_url_reason(
     url: str,
     sensitive_hosts: Iterable[str] = SENSITIVE_HOSTS,
     auth_path_hints: Iterable[str] = AUTH_PATH_HINTS,
     sensitive_query_keys: Iterable[str] = SENSITIVE_QUERY_KEYS,
-) -> bool:
+) -> Optional[str]:
+    """Return which condition makes ``url`` sensitive, or None when it is safe.
+
+    Checks run in the order ``default_kind_action`` resolves them, so the
+    reason alone is enough to pick kind/action without re-parsing the URL.
+    Calls with the default marker sets are memoized per URL.
+    """
+    if (
+        sensitive_hosts is SENSITIVE_HOSTS
+        and auth_path_hints is AUTH_PATH_HINTS
+        and sensitive_query_keys is SENSITIVE_QUERY_KEYS
+    ):
+        return _default_sensitive_url_reason(url)
+    return _sensitive_url_reason(url, sensitive_hosts, auth_path_hints, sensitive_query_keys)
+
+
+# Characters str.strip() removes from an ASCII query key.
+_ASCII_STRIP_RE = r"[ \t\n\r\x0b\x0c\x1c-\x1f]*"
+
+
+@lru_cache(maxsize=8)
+def _auth_hint_pattern(hints: Tuple[str, ...]) -> Optional[Pattern[str]]:
+    """One alternation equivalent to ``any(hint in text for hint in hints)``."""
+    if not hints:
+        return None
+    return re.compile("|".join(re.escape(hint) for hint in hints))
+
+
+@lru_cache(maxsize=8)
+def _sensitive_query_key_pattern(keys: FrozenSet[str]) -> Optional[Pattern[str]]:
+    """Match a raw ASCII query containing one of ``keys`` as a field name.
+
+    Only built for plain keys, so the regex agrees with ``query_keys`` on
+    queries without percent-escapes or ``+``; anything else returns None and
+    callers fall back to decoding the keys.
+    """
+    if not keys:
+        return None
+    for key in keys:
+        if not key or not key.isascii() or any(ch in key for ch in "&=%+"):
+            return None
+    alternation = "|".join(re.escape(key) for key in sorted(keys))
+    return re.compile(
+        rf"(?:^|&){_ASCII_STRIP_RE}(?:{alternation}){_ASCII_STRIP_RE}(?:=|&|$)",
+        re.IGNORECASE | re.ASCII,
+    )
+
+
+@lru_cache(maxsize=8)
+def _sensitive_key_set(keys: Tuple[str, ...]) -> FrozenSet[str]:
+    return frozenset(key.strip().lower() for key in keys)
+
+
+def _has_sensitive_query_key(query: str, sensitive_query_keys: Iterable[str]) -> bool:
+    if not query:
+        return False
+    sensitive_keys = _sensitive_key_set(tuple(sensitive_query_keys))
+    pattern = _sensitive_query_key_pattern(sensitive_keys)
+    if pattern is not None and query.isascii() and "%" not in query and "+" not in query:
+        return pattern.search(query) is not None
+    return any(key.strip().lower() in sensitive_keys for key in query_keys(query))
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def _default_sensitive_url_reason(url: str) -> Optional[str]:
+    return _sensitive_url_reason(url, SENSITIVE_HOSTS, AUTH_PATH_HINTS, SENSITIVE_QUERY_KEYS)
+
+
+def _sensitive_url_reason(
+    url: str,
+    sensitive_hosts: Iterable[str],
+    auth_path_hints: Iterable[str],
+    sensitive_query_keys: Iterable[str],
+) -> Optional[str]:
     try:
-        parsed = urllib.parse.urlsplit(url)
+        parsed = split_url(url)
     except Exception:
-        return True
+        return "unparseable"
 
     scheme = (parsed.scheme or "").lower()
-    if scheme not in {"http", "https"}:
-        return True
-
     host = (parsed.hostname or "").lower()
     path = (parsed.path or "").lower()
+
+    # file:// URLs intentionally map to local even though they have no host.
+    if scheme == "file":
+        return "file_scheme"
     if not host:
-        return True
-    if matches_sensitive_host_or_path(host, path, sensitive_hosts=sensitive_hosts):
-        return True
+        return "missing_host"
     if is_private_or_loopback_host(host):
-        return True
+        return "private_host"
 
-    lower_url = url.lower()
-    if any(hint in lower_url for hint in auth_path_hints):
-        return True
+    auth_hints = _auth_hint_pattern(tuple(auth_path_hints))
+    if auth_hints is not None and auth_hints.search(url.lower()):
+        return "auth_path_hint"
+    if matches_sensitive_host_or_path(host, path, sensitive_hosts=sensitive_hosts):
+        return "sensitive_host_match"
+
+    if scheme not in {"http", "https"}:
+        return "non_http_scheme"
+    if _has_sensitive_query_key(parsed.query, sensitive_query_keys):
+        return "sensitive_query_key"
+    return None
 
-    sensitive_keys = {key.strip().lower() for key in sensitive_query_keys}
-    for key, _ in urllib.parse.parse_qsl(parsed.query, keep_blank_values=True):
-        if key.strip().lower() in sensitive_keys:
-            return True
-    return False
+
+def kind_action_for_reason(reason: Optional[str]) -> Tuple[str, str]:
+    if reason is None:
+        return "misc", "triage"
+    return SENSITIVE_REASON_KIND_ACTION.get(reason, ("internal", "ignore"))
+
+
+def is_sensitive_url(
+    url: str,
+    sensitive_hosts: Iterable[str] = SENSITIVE_HOSTS,
+    auth_path_hints: Iterable[str] = AUTH_PATH_HINTS,
+    sensitive_query_keys: Iterable[str] = SENSITIVE_QUERY_KEYS,
+) -> bool:
+    reason = sensitive_url_reason(
+        url,
+        sensitive_hosts=sensitive_hosts,
+        auth_path_hints=auth_path_hints,
+        sensitive_query_keys=sensitive_query_keys,
+    )
+    return reason is not None
 
 
 def default_kind_action(
@@ -127,38 +320,18 @@ def default_kind_action(
     sensitive_hosts: Iterable[str] = SENSITIVE_HOSTS,
     sensitive_query_keys: Iterable[str] = SENSITIVE_QUERY_KEYS,
 ) -> Tuple[str, str]:
-    lower_url = url.lower()
-    try:
-        parsed = urllib.parse.urlsplit(url)
-    except Exception:
-        return "internal", "ignore"
-
-    scheme = (parsed.scheme or "").lower()
-    host = (parsed.hostname or "").lower()
-    path = (parsed.path or "").lower()
-
-    # file:// URLs intentionally map to local even though they have no host.
-    if scheme == "file":
-        return "local", "ignore"
+    reason = sensitive_url_reason(
+        url,
+        sensitive_hosts=sensitive_hosts,
+        auth_path_hints=auth_path_hints,
+        sensitive_query_keys=sensitive_query_keys,
+    )
+    return kind_action_for_reason(reason)
 
-    if not host:
-        return "internal", "ignore"
 
-    if is_private_or_loopback_host(host):
-        return "local", "ignore"
-    has_sensitive_query_key = False
-    if scheme in {"http", "https"}:
-        sensitive_keys = {key.strip().lower() for key in sensitive_query_keys}
-        for key, _ in urllib.parse.parse_qsl(parsed.query, keep_blank_values=True):
-            if key.strip().lower() in sensitive_keys:
-                has_sensitive_query_key = True
-                break
-    if any(hint in lower_url for hint in auth_path_hints) or matches_sensitive_host_or_path(
-        host,
-        path,
-        sensitive_hosts=sensitive_hosts,
-    ) or has_sensitive_query_key:
-        return "auth", "ignore"
-    if scheme not in {"http", "https"}:
-        return "internal", "ignore"
-    return "misc", "triage"
+def clear_caches() -> None:
+    """Drop memoized URL results (tests that patch urllib need a clean slate)."""
+    split_url.cache_clear()
+    normalize_url.cache_clear()
+    domain_of.cache_clear()
+    _default_sensitive_url_reason.cache_clear()
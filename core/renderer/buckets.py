@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import re
 from typing import Dict, Iterable, List, Tuple
 
-from core.tab_policy.matching import host_matches_base as _host_matches_base_shared
+from core.tab_policy.matching import (
+    HostBaseSet,
+    host_matches_base as _host_matches_base_shared,
+)
 
 from .config import SECTION_ORDER
 
@@ -12,9 +16,11 @@ from .config import SECTION_ORDER
 def _assign_buckets(items: List[dict], cfg: Dict) -> Dict[str, List[dict]]:
     buckets: Dict[str, List[dict]] = {name: [] for name in SECTION_ORDER}
 
+    appenders = {name: arr.append for name, arr in buckets.items()}
+    bucket_for_item = _bucket_for_item
+    project_opts = _project_opts(cfg)
     for item in items:
-        bucket = _bucket_for_item(item, cfg)
-        buckets[bucket].append(item)
+        appenders[bucket_for_item(item, cfg, project_opts)](item)
 
     # Quick wins tightening + overflow handling
     if cfg.get("includeQuickWins", True):
@@ -66,7 +72,7 @@ def _tighten_quick_wins(buckets: Dict[str, List[dict]], cfg: Dict) -> None:
         buckets["BACKLOG"] = moved_to_backlog + buckets.get("BACKLOG", [])
 
 
-def _bucket_for_item(item: dict, cfg: Dict) -> str:
+def _bucket_for_item(item: dict, cfg: Dict, project_opts: Dict | None = None) -> str:
     domain_category = item.get("domain_category") or ""
     kind = item.get("kind") or ""
     provided_kind = item.get("provided_kind") or ""
@@ -78,7 +84,7 @@ def _bucket_for_item(item: dict, cfg: Dict) -> str:
         return "MEDIA"
     if kind == "repo" or (domain_category == "code_host" and _looks_like_repo_path(path)):
         return "REPOS"
-    if _is_project_workspace(item, cfg):
+    if _is_project_workspace(item, cfg, project_opts):
         return "PROJECTS"
     if kind == "tool" or provided_kind == "tool" or domain_category == "console":
         return "TOOLS"
@@ -88,42 +94,62 @@ def _bucket_for_item(item: dict, cfg: Dict) -> str:
 
 
 def _looks_like_repo_path(path: str) -> bool:
-    parts = [p for p in (path or "").split("/") if p]
-    return len(parts) >= 2
+    # At least two non-empty segments, i.e. a "/" survives trimming the ends.
+    return "/" in (path or "").strip("/")
 
 
-def _is_project_workspace(item: dict, cfg: Dict) -> bool:
+def _lowered_hints(hints: Iterable[object]) -> Tuple[str, ...]:
+    return tuple(str(h).lower() for h in hints or ())
+
+
+def _project_opts(cfg: Dict) -> Dict:
+    """Resolve the project-workspace cfg lists once per render."""
+    suffix_ok = bool(cfg.get("projectDomainSuffixMatching", True))
+
+    def hosts(bases: Iterable[object]) -> HostBaseSet:
+        return HostBaseSet(bases or (), enable_suffix=suffix_ok, strip_www_host=True)
+
+    return {
+        "trello": hosts(["trello.com"]),
+        "jira": hosts(cfg.get("projectJiraDomains", [])),
+        "jira_hints": _lowered_hints(cfg.get("projectJiraPathHints", [])),
+        "figma": hosts(["figma.com"]),
+        "figma_hints": _lowered_hints(cfg.get("projectFigmaPathHints", [])),
+        "drive": hosts(["drive.google.com"]),
+        "notion": hosts(cfg.get("projectNotionDomains", [])),
+        "notion_hints": _lowered_hints(cfg.get("projectNotionHints", [])),
+        "notion_require_hint": cfg.get("projectNotionRequireHint", True),
+        "generic": hosts(cfg.get("projectDomains", [])),
+        "generic_hints": _lowered_hints(cfg.get("projectTitleHints", [])),
+    }
+
+
+def _is_project_workspace(item: dict, cfg: Dict, opts: Dict | None = None) -> bool:
+    if opts is None:
+        opts = _project_opts(cfg)
     domain = (item.get("domain") or "").lower()
     path = (item.get("path") or "").lower()
     title = (item.get("canonical_title") or item.get("title_render") or item.get("title") or "").lower()
     text_blob = f"{title} {path}"
-    suffix_ok = bool(cfg.get("projectDomainSuffixMatching", True))
 
-    def _matches_any_base(bases: Iterable[str]) -> bool:
-        return any(_host_matches_base(domain, str(base).lower(), suffix_ok) for base in (bases or []))
-
-    if _matches_any_base(["trello.com"]) and (path.startswith("/b/") or path.startswith("/c/")):
+    if opts["trello"].matches(domain) and (path.startswith("/b/") or path.startswith("/c/")):
         return True
 
-    jira_hints = [str(h).lower() for h in cfg.get("projectJiraPathHints", [])]
-    if _matches_any_base(cfg.get("projectJiraDomains", [])) and any(h in path for h in jira_hints):
+    if opts["jira"].matches(domain) and any(h in path for h in opts["jira_hints"]):
         return True
 
-    figma_hints = [str(h).lower() for h in cfg.get("projectFigmaPathHints", [])]
-    if _matches_any_base(["figma.com"]) and any(h in path for h in figma_hints):
+    if opts["figma"].matches(domain) and any(h in path for h in opts["figma_hints"]):
         return True
 
-    if _matches_any_base(["drive.google.com"]) and "/folders/" in path:
+    if opts["drive"].matches(domain) and "/folders/" in path:
         return True
 
-    notion_hints = [str(h).lower() for h in cfg.get("projectNotionHints", [])]
-    if _matches_any_base(cfg.get("projectNotionDomains", [])):
-        if not cfg.get("projectNotionRequireHint", True):
+    if opts["notion"].matches(domain):
+        if not opts["notion_require_hint"]:
             return True
-        return any(h in text_blob for h in notion_hints)
+        return any(h in text_blob for h in opts["notion_hints"])
 
-    generic_hints = [str(h).lower() for h in cfg.get("projectTitleHints", [])]
-    if _matches_any_base(cfg.get("projectDomains", [])) and any(h in text_blob for h in generic_hints):
+    if opts["generic"].matches(domain) and any(h in text_blob for h in opts["generic_hints"]):
         return True
 
     return False
@@ -257,6 +283,20 @@ SHOPPING_KEYWORDS = {
 }
 
 
+# Keyed by quickWinsDomainSuffixMatching, so the domain sets are built once.
+_LEISURE_HOSTS = {
+    suffix_ok: HostBaseSet(LEISURE_DOMAINS, enable_suffix=suffix_ok, strip_www_host=True) for suffix_ok in (True, False)
+}
+_SHOPPING_HOSTS = {
+    suffix_ok: HostBaseSet(SHOPPING_DOMAINS, enable_suffix=suffix_ok, strip_www_host=True) for suffix_ok in (True, False)
+}
+
+# Each keyword set as one alternation: a single scan of the blob answers
+# any(keyword in blob) instead of one substring pass per keyword.
+_LEISURE_KEYWORD_RE = re.compile("|".join(re.escape(k) for k in sorted(LEISURE_KEYWORDS)))
+_SHOPPING_KEYWORD_RE = re.compile("|".join(re.escape(k) for k in sorted(SHOPPING_KEYWORDS)))
+
+
 def _host_matches_base(host: str, base: str, enable_suffix: bool) -> bool:
     return _host_matches_base_shared(
         host,
@@ -271,23 +311,18 @@ def _quick_mini_classify(it: dict, cfg: Dict) -> Tuple[str, str]:
     title = (it.get("canonical_title") or it.get("title_render") or it.get("title") or "").lower()
     url_blob = (it.get("url") or "").lower()
     text_blob = f"{title} {url_blob}"
-    suffix_ok = cfg.get("quickWinsDomainSuffixMatching", True)
+    suffix_ok = bool(cfg.get("quickWinsDomainSuffixMatching", True))
 
     if (it.get("domain_category") or "").startswith("admin_"):
         return "misc", "admin_path"
 
-    leisure_domain_hit = any(_host_matches_base(domain, base, suffix_ok) for base in LEISURE_DOMAINS)
-    shopping_domain_hit = any(_host_matches_base(domain, base, suffix_ok) for base in SHOPPING_DOMAINS)
-
-    leisure_kw_hit = any(k in text_blob for k in LEISURE_KEYWORDS)
-    shopping_kw_hit = any(k in text_blob for k in SHOPPING_KEYWORDS)
-
-    if shopping_domain_hit:
+    # Checked in precedence order; later scans only run when earlier ones miss.
+    if _SHOPPING_HOSTS[suffix_ok].matches(domain):
         return "shopping", "shopping_domain"
-    if leisure_domain_hit:
+    if _LEISURE_HOSTS[suffix_ok].matches(domain):
         return "leisure", "leisure_domain"
-    if shopping_kw_hit:
+    if _SHOPPING_KEYWORD_RE.search(text_blob):
         return "shopping", "shopping_keyword"
-    if leisure_kw_hit:
+    if _LEISURE_KEYWORD_RE.search(text_blob):
         return "leisure", "leisure_keyword"
     return "misc", "fallback_misc"
@@ -3,115 +3,231 @@
 from __future__ import annotations
 
 import re
-import urllib.parse
-from typing import Dict, Iterable
+from typing import Dict, FrozenSet, Iterable, Tuple
 
-from core.tab_policy.matching import host_matches_base
+from core.tab_policy.matching import HostBaseSet, query_keys
 
 from .config import ALLOWED_KINDS
 
 
 def _contains_any(text: str, patterns: Iterable[str]) -> bool:
-    for p in patterns or []:
-        if p.lower() in text:
+    rx = _substring_alternation(patterns)
+    return rx is not None and rx.search(text) is not None
+
+
+def _matches_any_regex(text: str, patterns: Iterable[str]) -> bool:
+    for rx in _search_patterns(patterns):
+        if rx.search(text):
             return True
     return False
 
 
-def _matches_any_regex(text: str, patterns: Iterable[str]) -> bool:
-    for rx in patterns or []:
+def _lowered_patterns(patterns: Iterable[str]) -> Tuple[str, ...]:
+    return tuple(p.lower() for p in patterns or ())
+
+
+def _substring_alternation(patterns: Iterable[str]) -> re.Pattern | None:
+    # One scan for any lowered hint; path hints share a leading "/", which
+    # the regex engine skips far faster than a substring pass per hint.
+    lowered = _lowered_patterns(patterns)
+    if not lowered:
+        return None
+    return re.compile("|".join(re.escape(p) for p in lowered))
+
+
+def _compiled_patterns(patterns: Iterable[str]) -> Tuple[re.Pattern, ...]:
+    compiled = []
+    for rx in patterns or ():
         try:
-            if re.search(rx, text):
-                return True
+            compiled.append(re.compile(rx))
         except re.error:
+            # Invalid user patterns are skipped, as before.
             continue
-    return False
+    return tuple(compiled)
+
+
+_LEADING_FLAGS_RE = re.compile(r"^(?:\(\?[aiLmsux]+\))+")
+# Numbered/named back-references and conditionals would point at the wrong
+# group once patterns share one numbering, so such lists are not merged.
+_GROUP_REFERENCE_RE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+
+def _search_patterns(patterns: Iterable[str]) -> Tuple[re.Pattern, ...]:
+    """Compiled patterns for ``_matches_any_regex``, merged into one alternation when safe.
+
+    One search over ``(?:a)|(?:b)`` answers ``any(rx.search(...))`` in a single
+    scan. Leading global flags such as ``(?i)`` become scoped ``(?i:...)``
+    groups; lists that cannot be merged faithfully keep one pattern each.
+    """
+    compiled = _compiled_patterns(patterns)
+    if len(compiled) < 2:
+        return compiled
+    parts = []
+    for rx in compiled:
+        source = rx.pattern
+        if not isinstance(source, str) or _GROUP_REFERENCE_RE.search(source):
+            return compiled
+        lead = _LEADING_FLAGS_RE.match(source)
+        if lead:
+            flags = "".join(dict.fromkeys(ch for ch in lead.group(0) if ch.isalpha()))
+            if "x" in flags:
+                # Verbose comments could swallow the closing parenthesis.
+                return compiled
+            parts.append(f"(?{flags}:{source[lead.end():]})")
+        else:
+            parts.append(f"(?:{source})")
+    try:
+        return (re.compile("|".join(parts)),)
+    except re.error:
+        return compiled
 
 
 def _query_has_any_key(query: str, keys: Iterable[str]) -> bool:
-    if not query:
-        return False
-    needles = {str(key).strip().lower() for key in (keys or []) if str(key).strip()}
-    if not needles:
+    return _query_has_needle(query, _query_key_needles(keys))
+
+
+def _query_key_needles(keys: Iterable[object]) -> FrozenSet[str]:
+    return frozenset(str(key).strip().lower() for key in keys or () if str(key).strip())
+
+
+def _query_has_needle(query: str, needles: FrozenSet[str]) -> bool:
+    if not query or not needles:
         return False
-    for key, _ in urllib.parse.parse_qsl(query, keep_blank_values=True):
+    # Only key names matter, so values are never split out or unquoted.
+    for key in query_keys(query):
         if key.strip().lower() in needles:
             return True
     return False
 
 
+def _host_category_groups(cfg: Dict) -> Tuple[Tuple[str, Iterable[object]], ...]:
+    return (
+        ("code_host", cfg.get("codeHostDomains", [])),
+        ("music", cfg.get("musicDomains", [])),
+        ("video", cfg.get("videoDomains", [])),
+        ("console", list(cfg.get("consoleDomains", [])) + list(cfg.get("toolDomains", []))),
+    )
+
+
+def _host_category_map(groups: Iterable[Tuple[str, Iterable[object]]]) -> Dict[str, Tuple[int, str]]:
+    # base -> (group rank, category); the earliest group wins for shared bases.
+    mapping: Dict[str, Tuple[int, str]] = {}
+    for rank, (category, bases) in enumerate(groups):
+        for base in bases or ():
+            norm = str(base or "").strip().lower()
+            if norm and norm not in mapping:
+                mapping[norm] = (rank, category)
+    return mapping
+
+
+def _host_category(host: str, groups: Iterable[Tuple[str, Iterable[object]]]) -> str:
+    """First category whose bases match ``host`` (exact or dot-suffix).
+
+    Same result as checking each group with ``host_matches_any_base`` in
+    order, but one dict probe per host label instead of a pass per group.
+    """
+    return _host_category_in(host, _host_category_map(groups))
+
+
+def _host_category_in(host: str, mapping: Dict[str, Tuple[int, str]]) -> str:
+    host = str(host or "").strip().lower()
+    if not host or not mapping:
+        return ""
+    # A base matches by suffix exactly when it equals the text after some dot.
+    best = mapping.get(host)
+    dot = host.find(".")
+    while dot != -1:
+        hit = mapping.get(host[dot + 1 :])
+        if hit is not None and (best is None or hit[0] < best[0]):
+            best = hit
+        dot = host.find(".", dot + 1)
+    return best[1] if best is not None else ""
+
+
+def _classify_opts(cfg: Dict) -> Dict:
+    """Resolve the cfg lists ``_classify_domain`` reads into lowered/compiled form.
+
+    Built once per render so per-item calls skip cfg lookups and recompiling.
+    """
+    return {
+        "skip_prefixes": _lowered_patterns(cfg.get("skipPrefixes", [])),
+        "chat_hosts": HostBaseSet(cfg.get("chatDomains", []) or ()),
+        "auth_regexes": _search_patterns(cfg.get("authPathRegex", [])),
+        "auth_hints": _substring_alternation(cfg.get("authPathHints", [])),
+        "auth_soft_hints": _substring_alternation(cfg.get("authContainsHintsSoft", [])),
+        "auth_soft_keys": _query_key_needles(cfg.get("authContainsHintsSoft", [])),
+        "require_strong_auth": cfg.get("adminAuthRequiresStrongSignal", True),
+        "host_categories": _host_category_map(_host_category_groups(cfg)),
+        "docs_prefix": str(cfg.get("docsDomainPrefix", "docs.")),
+        "docs_hints": _substring_alternation(cfg.get("docsPathHints", [])),
+        "blog_hints": _substring_alternation(cfg.get("blogPathHints", [])),
+    }
+
+
+def _search(rx: re.Pattern | None, text: str) -> bool:
+    return rx is not None and rx.search(text) is not None
+
+
 def _classify_domain(
     url: str,
     parsed,
     domain_display: str,
     flags: Dict,
     cfg: Dict,
+    lower_url: str | None = None,
+    opts: Dict | None = None,
 ) -> str:
-    lower_url = url.lower()
+    if lower_url is None:
+        lower_url = url.lower()
+    if opts is None:
+        opts = _classify_opts(cfg)
     hostname = domain_display.lower()
     scheme = (parsed.scheme or "").lower()
-    suffix_match = True
 
     # Admin forcing
     if flags.get("is_local") or hostname in {"localhost", "127.0.0.1"} or scheme == "file":
         return "admin_local"
     if scheme and scheme not in {"http", "https"}:
         return "admin_internal"
-    if flags.get("is_internal") or any(lower_url.startswith(p.lower()) for p in cfg.get("skipPrefixes", [])):
+    if flags.get("is_internal") or lower_url.startswith(opts["skip_prefixes"]):
         return "admin_internal"
-    if flags.get("is_chat") or any(
-        host_matches_base(hostname, str(base).lower(), enable_suffix=suffix_match) for base in cfg.get("chatDomains", [])
-    ):
+    if flags.get("is_chat") or opts["chat_hosts"].matches(hostname):
         return "admin_chat"
 
     # Admin auth strict detection
-    auth_strong = flags.get("is_auth") or hostname == "accounts.google.com" or _matches_any_regex(
-        parsed.path or "", cfg.get("authPathRegex", [])
-    ) or _contains_any(lower_url, cfg.get("authPathHints", [])) or _query_has_any_key(
-        parsed.query or "", cfg.get("authContainsHintsSoft", [])
+    path = parsed.path or ""
+    auth_strong = (
+        flags.get("is_auth")
+        or hostname == "accounts.google.com"
+        or any(rx.search(path) for rx in opts["auth_regexes"])
+        or _search(opts["auth_hints"], lower_url)
+        or _query_has_needle(parsed.query or "", opts["auth_soft_keys"])
     )
-    auth_soft = _contains_any(lower_url, cfg.get("authContainsHintsSoft", []))
-    require_strong = cfg.get("adminAuthRequiresStrongSignal", True)
-    if auth_strong or (auth_soft and not require_strong):
+    auth_soft = _search(opts["auth_soft_hints"], lower_url)
+    if auth_strong or (auth_soft and not opts["require_strong_auth"]):
         return "admin_auth"
 
     # Non-admin categories
-    if any(
-        host_matches_base(hostname, str(base).lower(), enable_suffix=suffix_match)
-        for base in cfg.get("codeHostDomains", [])
-    ):
-        return "code_host"
-    if any(
-        host_matches_base(hostname, str(base).lower(), enable_suffix=suffix_match)
-        for base in cfg.get("musicDomains", [])
-    ):
-        return "music"
-    if any(
-        host_matches_base(hostname, str(base).lower(), enable_suffix=suffix_match)
-        for base in cfg.get("videoDomains", [])
-    ):
-        return "video"
-    console_domains = list(cfg.get("consoleDomains", [])) + list(cfg.get("toolDomains", []))
-    if any(host_matches_base(hostname, str(base).lower(), enable_suffix=suffix_match) for base in console_domains):
-        return "console"
-    if hostname.startswith(str(cfg.get("docsDomainPrefix", "docs."))):
+    host_category = _host_category_in(hostname, opts["host_categories"])
+    if host_category:
+        return host_category
+    if hostname.startswith(opts["docs_prefix"]):
         return "docs_site"
-    if _contains_any(lower_url, cfg.get("docsPathHints", [])):
+    if _search(opts["docs_hints"], lower_url):
         return "docs_site"
-    if _contains_any(lower_url, cfg.get("blogPathHints", [])):
+    if _search(opts["blog_hints"], lower_url):
         return "blog"
     return "generic"
 
 
-def _derive_kind(domain_category: str, provided_kind: str, url: str) -> str:
-    lower_url = url.lower()
+def _derive_kind(domain_category: str, provided_kind: str, url: str, lower_url: str | None = None) -> str:
     if provided_kind in {"local", "auth", "internal"}:
         return "admin"
     if provided_kind in ALLOWED_KINDS:
         return provided_kind
     if domain_category.startswith("admin_"):
         return "admin"
-    if lower_url.endswith(".pdf"):
+    if (url.lower() if lower_url is None else lower_url).endswith(".pdf"):
         return "paper"
     if domain_category == "music":
         return "music"
@@ -3,19 +3,35 @@
 from __future__ import annotations
 
 import re
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from sys import intern
+from typing import Dict, Iterable, List, Tuple
 from urllib.parse import unquote, urlparse
 
 from core.tab_policy.actions import canonical_action
 
-from .classify import _classify_domain, _derive_kind
+from .classify import _classify_domain, _classify_opts, _derive_kind
 
 
-def _normalize_items(items_raw: List[dict], cfg: Dict) -> Tuple[List[dict], int]:
+def _normalize_items(items_raw: Iterable[dict], cfg: Dict) -> Tuple[List[dict], int]:
     seen_urls = set()
     deduped = 0
     normalized: List[dict] = []
     strip_www = bool(cfg.get("stripWwwForGrouping", True))
+    title_max_len = int(cfg.get("titleMaxLen", 96))
+    canonical_opts = _canonical_title_opts(cfg)
+    classify_opts = _classify_opts(cfg)
+    # Local aliases for the per-item hot path.
+    normalize_title = _normalize_title
+    truncate = _truncate
+    parse_url = urlparse
+    normalize_intent = _normalize_intent
+    normalize_effort = _normalize_effort
+    normalize_flags = _normalize_flags
+    classify_domain = _classify_domain
+    derive_kind = _derive_kind
+    canonical_title_with = _canonical_title_with
+    append = normalized.append
 
     for raw in items_raw:
         url = str(raw.get("url", "")).strip()
@@ -27,38 +43,48 @@ def _normalize_items(items_raw: List[dict], cfg: Dict) -> Tuple[List[dict], int]
         seen_urls.add(url)
 
         title_raw = str(raw.get("title", "") or "")
-        title_norm = _normalize_title(title_raw)
+        title_norm = normalize_title(title_raw)
         if not title_norm:
             continue
-        title_render = _truncate(title_norm, int(cfg.get("titleMaxLen", 96)))
+        # Most titles fit; only call _truncate when there is something to cut.
+        title_render = title_norm if len(title_norm) <= title_max_len else truncate(title_norm, title_max_len)
 
-        parsed = urlparse(url)
+        parsed = parse_url(url)
         hostname = parsed.hostname or ""
         domain_display = hostname
         if strip_www and domain_display.startswith("www."):
             domain_display = domain_display[4:]
-        domain_display = domain_display or "unknown"
+        # Low-cardinality fields repeat across thousands of items; interning
+        # shares one object per distinct value.
+        domain_display = intern(domain_display or "unknown")
         path = parsed.path or ""
 
-        browser = str(raw.get("browser") or "unknown").lower()
-        intent = _normalize_intent(raw.get("intent"))
-        effort = _normalize_effort(raw.get("effort"))
-        provided_kind = str(raw.get("kind") or "").strip().lower()
+        browser = intern(str(raw.get("browser") or "unknown").lower())
+        intent = normalize_intent(raw.get("intent"))
+        effort = intern(normalize_effort(raw.get("effort")))
+        provided_kind = intern(str(raw.get("kind") or "").strip().lower())
         flags_raw = raw.get("flags") or {}
-        flags = _normalize_flags(flags_raw, provided_kind=provided_kind)
-        topics = raw.get("topics") if isinstance(raw.get("topics"), list) else []
+        flags = normalize_flags(flags_raw, provided_kind=provided_kind)
+        topics = raw.get("topics")
+        if not isinstance(topics, list):
+            topics = []
 
-        domain_category = _classify_domain(
+        lower_url = url.lower()
+        domain_category = classify_domain(
             url,
             parsed,
             domain_display,
             flags,
             cfg,
+            lower_url,
+            classify_opts,
+        )
+        kind_norm = derive_kind(domain_category, provided_kind, url, lower_url)
+        canonical_title = canonical_title_with(
+            title_norm, domain_display, path, canonical_opts, title_is_normalized=True
         )
-        kind_norm = _derive_kind(domain_category, provided_kind, url)
-        canonical_title = _canonical_title(title_norm, domain_display, path, cfg)
 
-        normalized.append(
+        append(
             {
                 "url": url,
                 "title": title_norm,
@@ -82,9 +108,9 @@ def _normalize_items(items_raw: List[dict], cfg: Dict) -> Tuple[List[dict], int]
 
 
 def _normalize_title(title: str) -> str:
-    title = title.replace("\r\n", "\n").replace("\r", "\n")
-    title = re.sub(r"\s+", " ", title).strip()
-    return title
+    # str.split() breaks on the same Unicode whitespace as re's \s (CR/LF
+    # included), so this collapses runs and trims without the regex engine.
+    return " ".join(title.split())
 
 
 def _truncate(text: str, max_len: int) -> str:
@@ -95,51 +121,114 @@ def _truncate(text: str, max_len: int) -> str:
 
 
 def _canonical_title(title_norm: str, domain_display: str, path: str, cfg: Dict) -> str:
+    return _canonical_title_with(title_norm, domain_display, path, _canonical_title_opts(cfg))
+
+
+def _canonical_title_opts(cfg: Dict) -> Tuple:
+    """Resolve the canonical-title settings once so per-item calls skip cfg lookups."""
     if not cfg.get("canonicalTitleEnabled", True):
+        return (False, (), (), {}, 0)
+    return (
+        True,
+        _suffix_tuple(tuple(cfg.get("canonicalTitleStripSuffixes", []) or ())),
+        _compiled_prefix_patterns(tuple(cfg.get("canonicalTitleStripPrefixesRegex", []) or ())),
+        cfg.get("canonicalTitleHostRules", {}) or {},
+        int(cfg.get("canonicalTitleMaxLen", 88)),
+    )
+
+
+def _canonical_title_with(
+    title_norm: str,
+    domain_display: str,
+    path: str,
+    opts: Tuple,
+    *,
+    title_is_normalized: bool = False,
+) -> str:
+    enabled, suffixes, prefix_patterns, host_rules, max_len = opts
+    if not enabled:
         return title_norm
 
-    title = title_norm
+    # Most titles hit no rule at all: no host rule, no GitHub rewrite, no
+    # suffix, no prefix pattern. An already-normalized title then only
+    # needs the length cap.
+    if (
+        title_is_normalized
+        and domain_display != "github.com"
+        and not host_rules.get(domain_display)
+        and not (suffixes and title_norm.endswith(suffixes))
+        and not any(rx.search(title_norm) for rx in prefix_patterns)
+    ):
+        return title_norm if len(title_norm) <= max_len else _truncate(title_norm, max_len)
 
-    def strip_suffixes(txt: str, suffixes: List[str]) -> str:
-        changed = True
-        while changed:
-            changed = False
-            for suffix in suffixes:
-                if txt.endswith(suffix):
-                    txt = txt[: -len(suffix)].rstrip()
-                    changed = True
-        return txt
+    title = title_norm
 
     # Global suffix stripping
-    title = strip_suffixes(title, cfg.get("canonicalTitleStripSuffixes", []))
+    title = _strip_suffixes(title, suffixes)
 
     # Prefix regex stripping
-    for rx in cfg.get("canonicalTitleStripPrefixesRegex", []):
-        title = re.sub(rx, "", title)
+    for rx in prefix_patterns:
+        title = rx.sub("", title)
 
-    host_rules = cfg.get("canonicalTitleHostRules", {}) or {}
     host_rule = host_rules.get(domain_display)
     if host_rule:
-        title = strip_suffixes(title, host_rule.get("stripSuffixes", []))
+        title = _strip_suffixes(title, _suffix_tuple(tuple(host_rule.get("stripSuffixes", []) or ())))
+
+    # Both GitHub helpers walk the same path segments; split them once.
+    parts = None
 
     # GitHub repo slug preference
     if host_rule and host_rule.get("preferRepoSlug"):
-        slug_title = _github_repo_slug_title(path, title_norm)
+        parts = _path_parts(path)
+        slug_title = _github_repo_slug_title(path, title_norm, parts)
         if slug_title:
             title = slug_title
 
     if domain_display == "github.com":
-        blob_filename_title = _github_blob_filename_title(path, title, title_norm, domain_display)
+        if parts is None:
+            parts = _path_parts(path)
+        blob_filename_title = _github_blob_filename_title(path, title, title_norm, domain_display, parts)
         if blob_filename_title:
             title = blob_filename_title
 
-    title = re.sub(r"\s+", " ", title).strip()
-    title = _truncate(title or title_norm, int(cfg.get("canonicalTitleMaxLen", 88)))
+    title = " ".join(title.split())
+    title = _truncate(title or title_norm, max_len)
     return title or title_norm
 
 
-def _github_repo_slug_title(path: str, title_norm: str) -> str:
-    parts = [p for p in (path or "").split("/") if p]
+@lru_cache(maxsize=64)
+def _suffix_tuple(suffixes: Tuple[str, ...]) -> Tuple[str, ...]:
+    # Empty suffixes would strip the whole title and never stop matching.
+    return tuple(suffix for suffix in suffixes if suffix)
+
+
+def _strip_suffixes(txt: str, suffixes: Tuple[str, ...]) -> str:
+    """Strip suffixes in list order, repeating passes until none applies.
+
+    A pass changes the title exactly when some suffix matches at its start,
+    so one tuple ``endswith`` decides whether another pass is needed (and
+    rejects the common no-suffix title without a Python-level loop).
+    """
+    while suffixes and txt.endswith(suffixes):
+        for suffix in suffixes:
+            if txt.endswith(suffix):
+                txt = txt[: -len(suffix)].rstrip()
+    return txt
+
+
+@lru_cache(maxsize=32)
+def _compiled_prefix_patterns(patterns: Tuple[str, ...]) -> Tuple[re.Pattern, ...]:
+    # Compiled once per cfg list; an invalid pattern still raises re.error.
+    return tuple(re.compile(rx) for rx in patterns)
+
+
+def _path_parts(path: str) -> List[str]:
+    return [p for p in (path or "").split("/") if p]
+
+
+def _github_repo_slug_title(path: str, title_norm: str, parts: List[str] | None = None) -> str:
+    if parts is None:
+        parts = _path_parts(path)
     if len(parts) < 2:
         return ""
     slug = f"{parts[0]}/{parts[1]}"
@@ -156,8 +245,15 @@ def _github_repo_slug_title(path: str, title_norm: str) -> str:
     return slug
 
 
-def _github_blob_filename_title(path: str, current_title: str, title_norm: str, domain_display: str) -> str:
-    parts = [p for p in (path or "").split("/") if p]
+def _github_blob_filename_title(
+    path: str,
+    current_title: str,
+    title_norm: str,
+    domain_display: str,
+    parts: List[str] | None = None,
+) -> str:
+    if parts is None:
+        parts = _path_parts(path)
     if len(parts) < 5:
         return ""
     if parts[2] != "blob":
@@ -184,7 +280,7 @@ def _github_blob_filename_title(path: str, current_title: str, title_norm: str,
 
 def _normalize_intent(intent_val) -> Dict:
     if isinstance(intent_val, dict):
-        action = canonical_action(intent_val.get("action") or "")
+        action = intern(canonical_action(intent_val.get("action") or ""))
         conf = intent_val.get("confidence", 0.0)
     else:
         action = ""
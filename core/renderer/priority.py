@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import heapq
+import re
 from typing import Dict, List, Tuple
 
 from core.tab_policy.actions import action_priority_weight, canonical_action
 
 from .config import AGGREGATOR_MARKERS, DEPTH_HINTS, KIND_PRIORITY_INDEX
 
+# Constant marker lists as single alternations, so each candidate's title
+# and path are scanned once instead of once per marker.
+_AGGREGATOR_MARKER_RE = re.compile("|".join(re.escape(marker) for marker in AGGREGATOR_MARKERS))
+_DEPTH_HINT_RE = re.compile("|".join(re.escape(hint) for hint in DEPTH_HINTS))
+
 
 def _select_high_priority(buckets: Dict[str, List[dict]], cfg: Dict) -> None:
     eligible_buckets = {"DOCS", "REPOS", "MEDIA"}
@@ -16,7 +23,11 @@ def _select_high_priority(buckets: Dict[str, List[dict]], cfg: Dict) -> None:
     limit = int(cfg.get("highPriorityLimit", 5))
     eligible_categories = set(cfg.get("highPriorityEligibleCategories", []))
 
-    candidates: List[Tuple[int, int, float, str, str, dict]] = []
+    # Each candidate leads with its sort key (score desc, kind priority,
+    # intent confidence desc, domain asc, title asc) and a sequence number,
+    # so plain tuple comparison orders them: no key function, ties keep
+    # insertion order, and comparison never reaches the item dict.
+    candidates: List[Tuple[int, int, float, str, str, int, dict, str]] = []
     for bucket_name in eligible_buckets:
         for item in buckets.get(bucket_name, []):
             if item.get("domain_category") not in eligible_categories:
@@ -31,23 +42,25 @@ def _select_high_priority(buckets: Dict[str, List[dict]], cfg: Dict) -> None:
                 continue
             if conf < min_conf and item.get("kind") not in {"paper", "spec"}:
                 continue
-            candidates.append((score, kind_rank, conf, domain, title, item))
-
-    candidates.sort(
-        key=lambda tpl: (
-            -tpl[0],  # score desc
-            tpl[1],  # kind priority
-            -tpl[2],  # intent confidence desc
-            tpl[3],  # domain asc
-            tpl[4],  # title asc
-        )
-    )
-
-    selected = [tpl[5] for tpl in candidates[:limit]]
+            candidates.append((-score, kind_rank, -conf, domain, title, len(candidates), item, bucket_name))
+
+    # Only `limit` candidates survive, so select them with a bounded heap
+    # instead of sorting every candidate.
+    if limit >= 0:
+        top = heapq.nsmallest(limit, candidates)
+    else:
+        top = sorted(candidates)[:limit]
+
+    selected = [tpl[6] for tpl in top]
     selected_urls = {it["url"] for it in selected}
+    # Only buckets that gave up an item need filtering; the rest keep their list.
+    touched_buckets = {tpl[7] for tpl in top}
 
     for bucket_name in eligible_buckets:
-        buckets[bucket_name] = [it for it in buckets.get(bucket_name, []) if it["url"] not in selected_urls]
+        bucket_items = buckets.get(bucket_name, [])
+        if bucket_name in touched_buckets:
+            bucket_items = [it for it in bucket_items if it["url"] not in selected_urls]
+        buckets[bucket_name] = bucket_items
 
     buckets["HIGH"] = selected
 
@@ -90,11 +103,11 @@ def _score_item(item: dict) -> int:
         score -= 2
 
     # Aggregator penalty
-    if any(marker in title for marker in AGGREGATOR_MARKERS):
+    if _AGGREGATOR_MARKER_RE.search(title):
         score -= 2
 
     # Depth hint bonus
-    if any(hint in path for hint in DEPTH_HINTS):
+    if _DEPTH_HINT_RE.search(path):
         score += 1
 
     return int(score)
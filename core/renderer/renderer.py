@@ -9,7 +9,7 @@ from .config import DEFAULT_CFG, merge_cfg
 from .normalize import _normalize_items
 from .priority import _score_item, _select_high_priority
 from .rendering import _render_md
-from .validate import _annotate_bucket_on_items, _validate_coverage
+from .validate import _validate_coverage
 
 
 def render_markdown(payload: dict, cfg_override: Dict | None = None, cfg: Dict | None = None) -> str:
@@ -29,7 +29,11 @@ def render_markdown(payload: dict, cfg_override: Dict | None = None, cfg: Dict |
 
 
 def build_state(payload: dict, cfg_override: Dict | None = None, cfg: Dict | None = None) -> Dict:
-    """Build renderer state (useful for tests). Accepts `cfg` alias like render_markdown."""
+    """Build renderer state (useful for tests). Accepts `cfg` alias like render_markdown.
+
+    `payload["items"]` may be any iterable of item dicts (e.g. a generator);
+    it is consumed exactly once during normalization.
+    """
     if cfg_override is None:
         cfg_override = cfg
     elif cfg is not None:
@@ -47,8 +51,7 @@ def build_state(payload: dict, cfg_override: Dict | None = None, cfg: Dict | Non
 
     buckets = _assign_buckets(items, merged_cfg)
     _select_high_priority(buckets, merged_cfg)
-    _annotate_bucket_on_items(buckets)
-    _validate_coverage(items, buckets)
+    _validate_coverage(items, buckets, annotate=True)
 
     state = {
         "cfg": merged_cfg,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import heapq
 from collections import Counter
 from typing import Dict, List
 
@@ -12,18 +13,22 @@ from core.tab_policy.text import slugify_kebab
 from .config import DEFAULT_CFG
 
 
+def _ranked(counts: Counter, limit: int) -> List[str]:
+    # Same as sorted(...)[:limit] by (count desc, key asc), without sorting
+    # every distinct key when only the first few are shown.
+    return [key for key, _ in heapq.nsmallest(limit, counts.items(), key=lambda kv: (-kv[1], kv[0]))]
+
+
 def _top_domains(items: List[dict], limit: int) -> List[str]:
     non_admin = [it for it in items if not (it.get("domain_category") or "").startswith("admin_")]
     counts = Counter(it.get("domain") or "" for it in non_admin)
-    ranked = sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))
-    return [d for d, _ in ranked[:limit] if d]
+    return [d for d in _ranked(counts, limit) if d]
 
 
 def _top_kinds(items: List[dict], limit: int) -> List[str]:
     non_admin = [it for it in items if not (it.get("domain_category") or "").startswith("admin_")]
     counts = Counter(it.get("kind") or "" for it in non_admin)
-    ranked = sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))
-    return [k for k, _ in ranked[:limit] if k]
+    return [k for k in _ranked(counts, limit) if k]
 
 
 def _top_topics(items: List[dict], limit: int) -> List[str]:
@@ -43,8 +48,7 @@ def _top_topics(items: List[dict], limit: int) -> List[str]:
                 continue
             counts[slug] += 1
             break
-    ranked = sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))
-    return [slug for slug, _ in ranked[:limit]]
+    return _ranked(counts, limit)
 
 
 def _focus_line(items: List[dict]) -> str:
@@ -5,20 +5,22 @@ from __future__ import annotations
 from typing import Dict, List
 
 
-def _annotate_bucket_on_items(buckets: Dict[str, List[dict]]) -> None:
-    for bucket, arr in buckets.items():
-        for it in arr:
-            it["bucket"] = bucket
+def _validate_coverage(items: List[dict], buckets: Dict[str, List[dict]], *, annotate: bool = False) -> None:
+    """Check every item lands in exactly one bucket.
 
-
-def _validate_coverage(items: List[dict], buckets: Dict[str, List[dict]]) -> None:
+    With ``annotate=True`` the same walk also stores each item's bucket name
+    under ``"bucket"``, so build_state visits the bucketed items once.
+    """
     urls_all = {it["url"] for it in items}
     urls_bucketed = set()
-    for arr in buckets.values():
+    for bucket, arr in buckets.items():
         for it in arr:
-            if it["url"] in urls_bucketed:
-                raise ValueError(f"Duplicate URL across buckets: {it['url']}")
-            urls_bucketed.add(it["url"])
+            if annotate:
+                it["bucket"] = bucket
+            url = it["url"]
+            if url in urls_bucketed:
+                raise ValueError(f"Duplicate URL across buckets: {url}")
+            urls_bucketed.add(url)
     if urls_all != urls_bucketed:
         missing = urls_all - urls_bucketed
         raise ValueError(f"Not all items assigned to a bucket: {missing}")
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 from urllib.parse import urlsplit
 
@@ -163,8 +164,15 @@ def _clamp_level(level: int) -> int:
 
 
 def _base_level(kind: str, action: str) -> tuple[int, str]:
-    kind_norm = str(kind or "").strip().lower()
-    action_norm = canonical_action(action or "")
+    return _base_level_cached(str(kind or ""), str(action or ""))
+
+
+@lru_cache(maxsize=64)
+def _base_level_cached(kind: str, action: str) -> tuple[int, str]:
+    # Keyed on raw strings: the (kind, action) space is small and closed, so
+    # normalization runs once per distinct pair instead of once per item.
+    kind_norm = kind.strip().lower()
+    action_norm = canonical_action(action)
 
     if kind_norm in {"auth", "local", "internal"}:
         return 0, "base:sensitive_or_local"
@@ -1,7 +1,10 @@
-"""Shared hostname matching helpers."""
+"""Shared hostname and query-key matching helpers."""
 
 from __future__ import annotations
 
+import urllib.parse
+from typing import FrozenSet, Iterable, List, Optional, Tuple
+
 
 def host_matches_base(
     host: str,
@@ -21,3 +24,89 @@ def host_matches_base(
     if host_norm == base_norm:
         return True
     return bool(enable_suffix and host_norm.endswith("." + base_norm))
+
+
+# Past this many bases a per-label set probe beats one endswith(tuple) scan.
+_LABEL_WALK_MIN_BASES = 128
+
+
+class HostBaseSet:
+    """Many ``host_matches_base`` bases checked at once.
+
+    Bases are normalized once into a set of exact hosts. Small lists match
+    suffixes with one ``str.endswith`` over ``"." + base`` tuples; large
+    ones probe the set with each parent domain of the host instead, so the
+    cost tracks the number of host labels rather than the number of bases.
+    """
+
+    __slots__ = ("exact", "suffixes", "label_walk", "strip_www_host")
+
+    def __init__(
+        self,
+        bases: Iterable[object],
+        *,
+        enable_suffix: bool = True,
+        strip_www_host: bool = False,
+    ):
+        self.exact: FrozenSet[str] = frozenset(
+            norm for norm in (str(base or "").strip().lower() for base in bases) if norm
+        )
+        self.label_walk = bool(enable_suffix) and len(self.exact) >= _LABEL_WALK_MIN_BASES
+        self.suffixes: Tuple[str, ...] = (
+            tuple("." + base for base in self.exact) if enable_suffix and not self.label_walk else ()
+        )
+        self.strip_www_host = strip_www_host
+
+    def matches(self, host: str) -> bool:
+        host_norm = str(host or "").strip().lower()
+        if not host_norm:
+            return False
+        if self.strip_www_host and host_norm.startswith("www."):
+            host_norm = host_norm[4:]
+        exact = self.exact
+        if host_norm in exact:
+            return True
+        if not self.label_walk:
+            return host_norm.endswith(self.suffixes)
+        # host ends with "." + base exactly when base is the text after one of its dots.
+        dot = host_norm.find(".")
+        while dot != -1:
+            if host_norm[dot + 1 :] in exact:
+                return True
+            dot = host_norm.find(".", dot + 1)
+        return False
+
+
+def host_matches_any_base(
+    host: str,
+    bases: Optional[Iterable[object]],
+    *,
+    enable_suffix: bool = True,
+    strip_www_host: bool = False,
+) -> bool:
+    """``any(host_matches_base(host, base, ...) for base in bases)``.
+
+    For a one-off check. Callers matching many hosts against the same list
+    should build a ``HostBaseSet`` once and call ``matches`` per host.
+    """
+    return HostBaseSet(bases or (), enable_suffix=enable_suffix, strip_www_host=strip_www_host).matches(host)
+
+
+def query_keys(query: str) -> List[str]:
+    """Return decoded query keys, matching ``parse_qsl(..., keep_blank_values=True)``.
+
+    Only keys are unquoted; values are skipped since callers never need them.
+    """
+    if not query:
+        return []
+    keys = []
+    for field in query.split("&"):
+        if not field:
+            continue
+        key = field.split("=", 1)[0]
+        if "+" in key:
+            key = key.replace("+", " ")
+        if "%" in key:
+            key = urllib.parse.unquote(key)
+        keys.append(key)
+    return keys
@@ -3,10 +3,21 @@
 from __future__ import annotations
 
 import re
+import string
+
+_NON_SLUG_RE = re.compile(r"[^a-z0-9]+")
+# ASCII fast path: every character outside [a-z0-9] becomes "-".
+_ASCII_SLUG_TABLE = str.maketrans(
+    {chr(code): "-" for code in range(128) if chr(code) not in string.ascii_lowercase + string.digits}
+)
 
 
 def slugify_kebab(value: str, *, fallback: str = "misc") -> str:
     """Normalize text to lowercase kebab-case with a stable fallback."""
-    slug = re.sub(r"[^a-z0-9]+", "-", (value or "").strip().lower())
-    slug = re.sub(r"-+", "-", slug).strip("-")
+    text = (value or "").strip().lower()
+    if text.isascii():
+        # Dropping empty fields collapses dash runs and trims the ends at once.
+        slug = "-".join(filter(None, text.translate(_ASCII_SLUG_TABLE).split("-")))
+    else:
+        slug = _NON_SLUG_RE.sub("-", text).strip("-")
     return slug or fallback
@@ -7,6 +7,7 @@ MANIFEST_PATH="${ROOT_DIR}/scripts/runtime-manifest.sha256"
 TRACKED_FILES=(
   "core/monitor_tabs.py"
   "core/postprocess/__init__.py"
+  "core/postprocess/cache.py"
   "core/postprocess/cli.py"
   "core/postprocess/classify_local.py"
   "core/postprocess/coerce.py"
@@ -282,7 +282,6 @@ def run_live_llm_predictions(cases: Iterable[dict], *, model: str, api_key: str)
     case_list = list(cases)
     items = [build_item(case) for case in case_list]
     indexed = list(enumerate(items))
-    url_to_idx = {item.norm_url: idx for idx, item in indexed}
     stderr_capture = io.StringIO()
 
     def _call(_system: str, _user: str, _api_key: str):
@@ -295,7 +294,6 @@ def run_live_llm_predictions(cases: Iterable[dict], *, model: str, api_key: str)
 
     cls_map = llm.classify_with_llm(
         indexed_for_cls=indexed,
-        url_to_idx=url_to_idx,
         api_key=api_key,
         max_items=0,
         chunk_size=30,
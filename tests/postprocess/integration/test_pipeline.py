@@ -1,8 +1,9 @@
 import io
 from pathlib import Path
 
+from core.postprocess.classify_local import classify_local
 from core.postprocess.models import Item
-from core.postprocess.pipeline import build_clean_note
+from core.postprocess.pipeline import LOCAL_CLASSIFY_POOL_MIN_ITEMS, _classify_local_batch, build_clean_note
 from core.postprocess.urls import normalize_url
 
 
@@ -27,10 +28,9 @@ def test_build_clean_note_uses_llm_and_skips_sensitive_items():
     seen = {}
     captured = {}
 
-    def classify_with_llm(indexed_for_cls, url_to_idx, api_key):
+    def classify_with_llm(indexed_for_cls, api_key):
         seen["indexed"] = indexed_for_cls
         seen["api_key"] = api_key
-        assert url_to_idx[items[1].norm_url] == 1
         return {1: {"topic": "python", "kind": "docs", "action": "read", "score": 5}}
 
     def render(payload, cfg):
@@ -66,6 +66,108 @@ def test_build_clean_note_uses_llm_and_skips_sensitive_items():
     assert payload["items"][1]["effort"] == "medium"
 
 
+def test_build_clean_note_classifies_duplicate_urls_once():
+    items = [
+        _item("Docs", "https://docs.python.org/3/tutorial/", "docs.python.org"),
+        _item("Other", "https://example.com/article", "example.com"),
+        _item("Docs again", "https://docs.python.org/3/tutorial/?utm_source=x", "docs.python.org"),
+    ]
+    seen = {}
+    captured = {}
+
+    def classify_with_llm(indexed_for_cls, api_key):
+        seen["indexed"] = [idx for idx, _ in indexed_for_cls]
+        return {
+            0: {"topic": "python", "kind": "docs", "action": "read", "score": 5},
+            1: {"topic": "misc", "kind": "article", "action": "read", "score": 3},
+        }
+
+    def render(payload, cfg):
+        captured["payload"] = payload
+        return "md"
+
+    build_clean_note(
+        src_path=Path("/tmp/in.md"),
+        items=items,
+        llm_enabled=True,
+        resolve_openai_api_key_fn=lambda: "k",
+        classify_with_llm_fn=classify_with_llm,
+        extract_created_ts_fn=lambda *_args, **_kwargs: "ts",
+        render_markdown_fn=render,
+        stderr=io.StringIO(),
+    )
+
+    assert seen["indexed"] == [0, 1]
+    out = captured["payload"]["items"]
+    assert len(out) == 3
+    assert out[2]["kind"] == "docs"
+    assert out[2]["topics"][0]["slug"] == "python"
+
+
+def test_build_clean_note_does_not_prompt_for_items_without_url():
+    items = [
+        Item(title="Blank", url="", norm_url="", clean_url="", domain="", browser=None),
+        _item("Docs", "https://docs.python.org/3/tutorial/", "docs.python.org"),
+    ]
+    seen = {}
+
+    def classify_with_llm(indexed_for_cls, api_key):
+        seen["indexed"] = [idx for idx, _ in indexed_for_cls]
+        return {1: {"topic": "python", "kind": "docs", "action": "read", "score": 5}}
+
+    build_clean_note(
+        src_path=Path("/tmp/in.md"),
+        items=items,
+        llm_enabled=True,
+        resolve_openai_api_key_fn=lambda: "k",
+        classify_with_llm_fn=classify_with_llm,
+        is_sensitive_url_fn=lambda _url: False,
+        extract_created_ts_fn=lambda *_args, **_kwargs: "ts",
+        render_markdown_fn=lambda payload, cfg: "md",
+        stderr=io.StringIO(),
+    )
+
+    assert seen["indexed"] == [1]
+
+
+def test_build_clean_note_derives_sensitive_kind_action_from_reason():
+    items = [
+        _item("Local", "http://localhost:3000/admin", "localhost:3000"),
+        _item("Login", "https://example.com/login", "example.com"),
+        _item("Docs", "https://docs.python.org/3/tutorial/", "docs.python.org"),
+    ]
+    seen_reasons = []
+    captured = {}
+
+    def sensitive_url_reason(url):
+        reason = "private_host" if "localhost" in url else ("auth_path_hint" if "login" in url else None)
+        seen_reasons.append(reason)
+        return reason
+
+    def render(payload, cfg):
+        captured["payload"] = payload
+        return "md"
+
+    build_clean_note(
+        src_path=Path("/tmp/in.md"),
+        items=items,
+        llm_enabled=False,
+        resolve_openai_api_key_fn=lambda: None,
+        classify_with_llm_fn=lambda *_args, **_kwargs: {},
+        classify_local_fn=lambda _item_obj: {"topic": "python", "kind": "docs", "action": "read", "score": 4},
+        sensitive_url_reason_fn=sensitive_url_reason,
+        extract_created_ts_fn=lambda *_args, **_kwargs: "ts",
+        render_markdown_fn=render,
+        stderr=io.StringIO(),
+    )
+
+    assert seen_reasons == ["private_host", "auth_path_hint", None]
+    out = captured["payload"]["items"]
+    assert (out[0]["kind"], out[0]["intent"]["action"]) == ("local", "ignore")
+    assert (out[1]["kind"], out[1]["intent"]["action"]) == ("auth", "ignore")
+    assert out[2]["kind"] == "docs"
+
+
 def test_build_clean_note_falls_back_to_local_when_llm_enabled_but_key_missing():
     items = [_item("Title", "https://example.com/article", "example.com")]
     stderr = io.StringIO()
@@ -245,3 +347,116 @@ def test_build_clean_note_effort_does_not_collapse_for_core_kinds():
 
     for kind in ("video", "docs", "article", "repo", "tool"):
         assert len(effort_by_kind[kind]) >= 2, f"{kind} effort collapsed: {sorted(effort_by_kind[kind])}"
+
+
+def test_classify_local_batch_pool_matches_serial_results():
+    items = [
+        _item(f"Guide {i}", f"https://docs.example.com/guide/{i}", "docs.example.com")
+        for i in range(LOCAL_CLASSIFY_POOL_MIN_ITEMS)
+    ]
+    serial = _classify_local_batch(items, classify_local, workers=0, stderr=io.StringIO())
+    pooled = _classify_local_batch(items, classify_local, workers=2, stderr=io.StringIO())
+
+    assert pooled == serial
+
+
+def test_classify_local_batch_falls_back_to_serial_when_pool_fails():
+    items = [
+        _item(f"Item {i}", f"https://example.com/{i}", "example.com")
+        for i in range(LOCAL_CLASSIFY_POOL_MIN_ITEMS)
+    ]
+    stderr = io.StringIO()
+
+    # Lambdas cannot be pickled into worker processes.
+    out = _classify_local_batch(items, lambda item: {"topic": item.title}, workers=2, stderr=stderr)
+
+    assert [row["topic"] for row in out] == [item.title for item in items]
+    assert "running serially" in stderr.getvalue()
+
+
+def test_build_clean_note_shared_flags_survive_real_render():
+    from core.postprocess import pipeline
+
+    items = [
+        _item("Docs", "https://docs.python.org/3/tutorial/", "docs.python.org"),
+        _item("Local", "http://localhost:8000/", "localhost"),
+    ]
+
+    md, _meta = build_clean_note(
+        src_path=Path("/tmp/in.md"),
+        items=items,
+        llm_enabled=False,
+        resolve_openai_api_key_fn=lambda: None,
+        classify_with_llm_fn=lambda *_args: {},
+        extract_created_ts_fn=lambda *_args, **_kwargs: "2026-02-08 00-00-00",
+        stderr=io.StringIO(),
+    )
+
+    assert "docs.python.org" in md
+    assert pipeline._EMPTY_FLAGS == {}
+
+
+def test_build_clean_note_shares_topic_entries_per_topic():
+    captured = {}
+
+    def fake_render(payload, *_args, **_kwargs):
+        captured["items"] = payload["items"]
+        return "md"
+
+    items = [
+        _item("One", "https://docs.python.org/3/a", "docs.python.org"),
+        _item("Two", "https://docs.python.org/3/b", "docs.python.org"),
+        _item("Three", "https://github.com/org/repo", "github.com"),
+    ]
+
+    build_clean_note(
+        src_path=Path("/tmp/in.md"),
+        items=items,
+        llm_enabled=False,
+        resolve_openai_api_key_fn=lambda: None,
+        classify_with_llm_fn=lambda *_args: {},
+        extract_created_ts_fn=lambda *_args, **_kwargs: "2026-02-08 00-00-00",
+        render_markdown_fn=fake_render,
+        stderr=io.StringIO(),
+    )
+
+    first, second, third = captured["items"]
+    assert first["topics"] is second["topics"]
+    assert first["topics"][0]["confidence"] == 0.8
+    assert third["topics"] is not first["topics"]
+
+
+def test_build_clean_note_classifies_duplicate_urls_locally_once():
+    items = [
+        _item("Docs", "https://docs.python.org/3/tutorial/", "docs.python.org"),
+        _item("Other", "https://example.com/article", "example.com"),
+        _item("Docs again", "https://docs.python.org/3/tutorial/?utm_source=x", "docs.python.org"),
+    ]
+    seen = []
+    captured = {}
+
+    def classify_local(item):
+        seen.append(item.title)
+        return {"topic": "t", "kind": "docs", "action": "read", "score": 4}
+
+    def render(payload, cfg):
+        captured["payload"] = payload
+        return "md"
+
+    build_clean_note(
+        src_path=Path("/tmp/in.md"),
+        items=items,
+        llm_enabled=False,
+        resolve_openai_api_key_fn=lambda: None,
+        classify_with_llm_fn=lambda *_args: {},
+        classify_local_fn=classify_local,
+        extract_created_ts_fn=lambda *_args, **_kwargs: "ts",
+        render_markdown_fn=render,
+        stderr=io.StringIO(),
+    )
+
+    assert seen == ["Docs", "Other"]
+    out = captured["payload"]["items"]
+    assert [item["title"] for item in out] == ["Docs", "Other", "Docs again"]
+    assert out[2]["kind"] == "docs"
+    assert captured["payload"]["counts"]["total"] == 3
@@ -111,7 +111,7 @@ def test_llm_id_mapping_uses_ids_not_urls(monkeypatch):
     assert payload_items[0]["effort"] == "medium"
 
 
-def test_llm_mapping_fallback_to_url(monkeypatch):
+def test_llm_url_only_echo_is_not_mapped(monkeypatch, capsys):
     items = _make_items(1)
 
     def fake_call(system, user, **kwargs):
@@ -135,9 +135,10 @@ def test_llm_mapping_fallback_to_url(monkeypatch):
     ppt.build_clean_note(Path("/tmp/ignore.md"), items, dump_id="id")
 
     payload_items = captured["payload"]["items"]
-    assert payload_items[0]["kind"] == "docs"
-    assert payload_items[0]["topics"][0]["slug"] == "beta"
-    assert payload_items[0]["effort"] == "medium"
+    assert payload_items[0]["topics"][0]["slug"] != "beta"
+    err = capsys.readouterr().err
+    assert "invalid_item_id=1" in err
+    assert "fallback_local=1" in err
 
 
 def test_llm_effort_passthrough_and_missing_fallback(monkeypatch):
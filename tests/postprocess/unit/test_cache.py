@@ -0,0 +1,97 @@
+import io
+import sqlite3
+import stat
+from contextlib import closing
+
+from core.postprocess import cache as cache_mod
+from core.postprocess.models import Item
+from core.postprocess.urls import normalize_url
+
+
+def _item(i: int) -> Item:
+    url = f"https://example.com/page/{i}"
+    clean = normalize_url(url)
+    return Item(title=f"Page {i}", url=url, norm_url=clean, clean_url=clean, domain="example.com", browser=None)
+
+
+def test_classification_cache_round_trip_is_private_and_hashed(tmp_path):
+    path = tmp_path / "nested" / "cls.sqlite"
+    cache = cache_mod.ClassificationCache(path, model="m1")
+    cache.put_many({"https://example.com/page/1": {"topic": "x", "kind": "docs", "action": "read"}})
+
+    assert cache.get_many(["https://example.com/page/1", "https://example.com/other"]) == {
+        "https://example.com/page/1": {"action": "read", "kind": "docs", "topic": "x"}
+    }
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    cache.close()
+
+    assert b"example.com" not in path.read_bytes()
+    other_model = cache_mod.ClassificationCache(path, model="m2")
+    assert other_model.get_many(["https://example.com/page/1"]) == {}
+    other_model.close()
+
+
+def test_classification_cache_expires_old_rows(tmp_path):
+    now = {"t": 1_000_000}
+    cache = cache_mod.ClassificationCache(tmp_path / "cls.sqlite", model="m", max_age_sec=60, clock=lambda: now["t"])
+    cache.put_many({"u": {"kind": "docs", "action": "read"}})
+    now["t"] += 61
+
+    assert cache.get_many(["u"]) == {}
+    cache.close()
+
+
+def test_classification_cache_deletes_expired_rows_on_write(tmp_path):
+    now = {"t": 1_000_000}
+    path = tmp_path / "cls.sqlite"
+    cache = cache_mod.ClassificationCache(path, model="m", max_age_sec=60, clock=lambda: now["t"])
+    cache.put_many({"old": {"kind": "docs", "action": "read"}, "kept": {"kind": "docs", "action": "read"}})
+    now["t"] += 30
+    cache.put_many({"kept": {"kind": "repo", "action": "build"}})
+    now["t"] += 31
+    cache.put_many({"new": {"kind": "docs", "action": "read"}})
+
+    cache.close()
+
+    with closing(sqlite3.connect(str(path))) as conn:
+        keys = {key for (key,) in conn.execute("SELECT key FROM cls")}
+    assert keys == {cache_mod.cache_key(url, "m") for url in ("kept", "new")}
+
+
+def test_classification_cache_tightens_existing_file_permissions(tmp_path):
+    path = tmp_path / "cls.sqlite"
+    path.touch(mode=0o644)
+    path.chmod(0o644)
+
+    cache = cache_mod.ClassificationCache(path, model="m")
+    cache.close()
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+
+def test_with_classification_cache_only_sends_misses_and_stores_valid_verdicts(tmp_path):
+    items = [_item(0), _item(1), _item(2)]
+    cache = cache_mod.ClassificationCache(tmp_path / "cls.sqlite", model="m")
+    cache.put_many({items[0].norm_url: {"topic": "cached", "kind": "docs", "action": "read", "score": 4}})
+    sent = []
+
+    def classify(indexed_for_cls, api_key):
+        sent.append([idx for idx, _ in indexed_for_cls])
+        return {
+            1: {"id": 1, "topic": "fresh", "kind": "repo", "action": "build", "score": 5},
+            2: {"id": 2, "topic": "bad", "kind": "nonsense", "action": "read"},
+        }
+
+    stderr = io.StringIO()
+    wrapped = cache_mod.with_classification_cache(classify, cache, stderr=stderr)
+    out = wrapped(list(enumerate(items)), "k")
+
+    assert sent == [[1, 2]]
+    assert out[0]["topic"] == "cached"
+    assert out[1]["topic"] == "fresh"
+    assert "hits=1 misses=2" in stderr.getvalue()
+
+    stored = cache.get_many(item.norm_url for item in items)
+    assert stored[items[1].norm_url] == {"topic": "fresh", "kind": "repo", "action": "build", "score": 5}
+    assert items[2].norm_url not in stored
+    cache.close()
@@ -1,3 +1,5 @@
+import pickle
+
 from core.postprocess.classify_local import (
     allowed_actions_for_kind,
     classify_local,
@@ -51,6 +53,13 @@ def test_topic_from_keywords_prefers_keyword_map_then_special_hints():
     assert topic_from_keywords("linear.app board") == "project-management"
 
 
+def test_topic_from_keywords_follows_topic_order_not_match_position():
+    # "sql" (postgres) appears first in the text, but architecture is listed first.
+    assert topic_from_keywords("sql patterns") == "architecture"
+    assert topic_from_keywords("go tutorial") == "go"
+    assert topic_from_keywords("let's go outside") is None
+
+
 def test_infer_local_kind_precedence_paper_over_blog_and_other_hints():
     item = _item("post", "https://example.com/blog/file.pdf")
     assert infer_local_kind(item) == "paper"
@@ -134,3 +143,45 @@ def test_classify_local_end_to_end():
     assert cls["action"] == "deep_work"
     assert cls["topic"] == "research"
     assert cls["score"] == 5
+
+
+def test_item_derived_url_views_are_computed_once():
+    item = _item("Σ Guide", "https://Docs.Example.com/Path?q=1")
+
+    assert item.host == "docs.example.com"
+    assert item.parsed_url is item.parsed_url
+    assert item.text_lower == f"{item.title} {item.clean_url}".lower()
+    assert item == _item("Σ Guide", "https://Docs.Example.com/Path?q=1")
+
+
+def test_classify_local_handles_unsplittable_url():
+    item = Item(title="Broken", url="http://[::1", norm_url="http://[::1", clean_url="http://[::1", domain="", browser=None)
+
+    assert item.parsed_url is None
+    assert item.host == ""
+    assert classify_local(item)["kind"] == "misc"
+
+
+def test_item_uses_slots_and_pickles_with_derived_views():
+    item = _item("Docs", "https://docs.python.org/3/")
+    assert not hasattr(item, "__dict__")
+    assert item.host == "docs.python.org"
+
+    clone = pickle.loads(pickle.dumps(item))
+    assert clone == item
+    assert clone.host == "docs.python.org"
+
+
+def test_host_sets_match_case_whitespace_and_subdomains():
+    from core.postprocess import classify_local
+
+    assert classify_local._CODE_HOSTS.matches("GitHub.com")
+    assert classify_local._CODE_HOSTS.matches(" github.com ")
+    assert classify_local._CODE_HOSTS.matches("gist.github.com")
+    assert classify_local._VIDEO_HOSTS.matches("m.youtube.com")
+    assert classify_local._SOCIAL_HOSTS.matches("www.reddit.com")
+    assert classify_local._MUSIC_HOSTS.matches("open.spotify.com")
+    for host in ["", " ", "notgithub.com"]:
+        assert not classify_local._CODE_HOSTS.matches(host), host
+    assert not classify_local._VIDEO_HOSTS.matches("xyoutube.com")
+    assert not classify_local._TOOL_HOSTS.matches("example.com")
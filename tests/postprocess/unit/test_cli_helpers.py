@@ -59,3 +59,76 @@ def test_find_root_falls_back_when_no_candidate_found(tmp_path: Path):
 
     # Fallback branch returns path.parent.parent when no candidate contains core/renderer/renderer.py.
     assert cli._find_root(fake_cli) == fake_cli.parent.parent
+
+
+def test_write_text_chunked_matches_write_text(tmp_path):
+    text = "---\ntabdump_id: x\n---\n" + "".join(f"- [Tab é{i}](https://example.com/{i})\n" for i in range(50))
+    expected = tmp_path / "expected.md"
+    expected.write_text(text, encoding="utf-8")
+
+    for chunk_chars in (1, 7, len(text), len(text) + 10):
+        out = tmp_path / f"out-{chunk_chars}.md"
+        cli._write_text_chunked(out, text, chunk_chars=chunk_chars)
+        assert out.read_bytes() == expected.read_bytes()
+
+    empty = tmp_path / "empty.md"
+    cli._write_text_chunked(empty, "")
+    assert empty.read_bytes() == b""
+
+
+def test_key_from_keychain_spawns_lookup_once_per_process(monkeypatch):
+    calls = []
+
+    def fake_lookup(service, account):
+        calls.append((service, account))
+        return None if len(calls) == 1 else "late"
+
+    monkeypatch.setattr(cli, "_KEYCHAIN_LOOKUPS", {})
+    monkeypatch.setattr(cli, "_key_from_keychain_impl", fake_lookup)
+    monkeypatch.setenv("OPENAI_API_KEY", "env-key")
+
+    assert cli.resolve_openai_api_key() == "env-key"
+    assert cli.resolve_openai_api_key() == "env-key"
+    assert calls == [(cli.KEYCHAIN_SERVICE, cli.KEYCHAIN_ACCOUNT)]
+
+
+def test_build_clean_note_takes_created_ts_from_head_lines(monkeypatch):
+    captured = {}
+
+    def fake_render(payload, *args, **kwargs):
+        captured["payload"] = payload
+        return "md"
+
+    def no_reread(_src_path, fallback):
+        raise AssertionError("source should not be reopened")
+
+    monkeypatch.setattr(cli, "LLM_ENABLED", False)
+    monkeypatch.setattr(cli, "render_markdown", fake_render)
+    monkeypatch.setattr(cli, "_extract_created_ts", no_reread)
+    items = cli.extract_items("- [Example](https://example.com/a)\n")
+    head = ["---\n", "created: 2026-02-07 10-00-00\r\n", "tabdump_id: x\n", "---\n"]
+
+    cli.build_clean_note(Path("/nonexistent/dump.md"), items, dump_id="x", head_lines=head)
+
+    assert captured["payload"]["meta"]["created"] == "2026-02-07 10-00-00"
+
+
+def test_main_parses_items_through_extract_items(monkeypatch, tmp_path):
+    src = tmp_path / "dump.md"
+    src.write_text("---\ntabdump_id: x\n---\n- [Example](https://example.com/a)\n", encoding="utf-8")
+    seen = []
+    real_extract_items = cli.extract_items
+
+    def wrapped(md):
+        items = real_extract_items(md)
+        seen.append([item.url for item in items])
+        return items
+
+    monkeypatch.setattr(cli, "extract_items", wrapped)
+    monkeypatch.setattr(cli, "build_clean_note", lambda *_args, **_kwargs: ("md", {}))
+
+    assert cli.main(["cli.py", str(src)]) == 0
+    assert seen == [["https://example.com/a"]]
+    assert cli.extract_items(["- [A](https://a.example)\n- [B](https://b.example)\n"]) == cli.extract_items(
+        "- [A](https://a.example)\n- [B](https://b.example)\n"
+    )
@@ -1,6 +1,5 @@
 import json
-import urllib.error
-from io import BytesIO
+import threading
 from io import StringIO
 from types import SimpleNamespace
 
@@ -66,7 +65,125 @@ def test_openai_chat_json_missing_key_raises(monkeypatch):
     assert "OPENAI_API_KEY" in msg
 
 
+class FakeHTTPResponse:
+    def __init__(self, status, body, will_close=False):
+        self.status = status
+        self._body = body
+        self.will_close = will_close
+
+    def read(self):
+        return self._body
+
+
+class FakeConnection:
+    """Stands in for http.client.HTTPSConnection; replays queued responses."""
+
+    def __init__(self, responses, log):
+        self.responses = responses
+        self.log = log
+        self.closed = False
+
+    def request(self, method, path, body=None, headers=None):
+        self.log.append({"method": method, "path": path, "body": body, "headers": headers, "conn": self})
+
+    def getresponse(self):
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def close(self):
+        self.closed = True
+
+
+def _install_fake_client(monkeypatch, responses):
+    log = []
+    opened = []
+
+    def factory(host, timeout):
+        opened.append({"host": host, "timeout": timeout})
+        return FakeConnection(responses, log)
+
+    monkeypatch.setattr(llm.urllib.request, "getproxies", lambda: {})
+    monkeypatch.setattr(llm, "_OPENAI_CLIENT", llm.KeepAliveHTTPSClient(llm.OPENAI_HOST, connection_factory=factory))
+    return log, opened
+
+
+def _ok_response(content):
+    body = {"choices": [{"message": {"content": json.dumps(content)}}]}
+    return FakeHTTPResponse(200, json.dumps(body).encode("utf-8"))
+
+
 def test_openai_chat_json_happy_path(monkeypatch):
+    log, opened = _install_fake_client(monkeypatch, [_ok_response({"ok": True})])
+
+    out = llm.openai_chat_json("system", "user", model="gpt-4.1-mini", api_key="key")
+
+    assert out == {"ok": True}
+    assert opened == [{"host": "api.openai.com", "timeout": 120}]
+    assert log[0]["method"] == "POST"
+    assert log[0]["path"] == "/v1/chat/completions"
+    assert log[0]["headers"]["Authorization"] == "Bearer key"
+    assert json.loads(log[0]["body"].decode("utf-8"))["model"] == "gpt-4.1-mini"
+
+
+def test_openai_chat_json_reuses_connection_across_calls(monkeypatch):
+    log, opened = _install_fake_client(monkeypatch, [_ok_response({"n": 1}), _ok_response({"n": 2})])
+
+    assert llm.openai_chat_json("system", "a", api_key="key") == {"n": 1}
+    assert llm.openai_chat_json("system", "b", api_key="key") == {"n": 2}
+
+    assert len(opened) == 1
+    assert log[0]["conn"] is log[1]["conn"]
+
+
+def test_openai_chat_json_reconnects_after_stale_keepalive(monkeypatch):
+    log, opened = _install_fake_client(
+        monkeypatch,
+        [llm.http.client.RemoteDisconnected("idle"), _ok_response({"ok": True})],
+    )
+
+    assert llm.openai_chat_json("system", "user", api_key="key") == {"ok": True}
+    assert len(opened) == 2
+    assert log[0]["conn"].closed is True
+
+
+def test_keepalive_client_close_all_releases_worker_thread_connections():
+    conns = []
+
+    def factory(host, timeout):
+        conn = FakeConnection([_ok_response({})], [])
+        conns.append(conn)
+        return conn
+
+    client = llm.KeepAliveHTTPSClient(llm.OPENAI_HOST, connection_factory=factory)
+    workers = [threading.Thread(target=client.post, args=("/p", b"{}", {})) for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert len(conns) == 3
+    assert not any(conn.closed for conn in conns)
+    client.close_all()
+    assert all(conn.closed for conn in conns)
+
+
+def test_classify_with_llm_closes_connections_on_pooled_and_serial_paths(monkeypatch):
+    closed = []
+    monkeypatch.setattr(llm._OPENAI_CLIENT, "close_all", lambda: closed.append(True))
+    items = [_item(i) for i in range(4)]
+
+    def fake_call(system, user, api_key):
+        return {"items": []}
+
+    llm.classify_with_llm(list(enumerate(items)), "k", chunk_size=1, parallel=2, call_with_retries_fn=fake_call)
+    assert closed == [True]
+    llm.classify_with_llm(list(enumerate(items)), "k", chunk_size=4, parallel=2, call_with_retries_fn=fake_call)
+    assert closed == [True, True]
+
+
+def test_openai_chat_json_uses_urllib_when_proxy_configured(monkeypatch):
     captured = {}
 
     class DummyResp:
@@ -77,84 +194,51 @@ def test_openai_chat_json_happy_path(monkeypatch):
             return False
 
         def read(self):
-            body = {
-                "choices": [
-                    {
-                        "message": {
-                            "content": json.dumps({"ok": True}),
-                        }
-                    }
-                ]
-            }
-            return json.dumps(body).encode("utf-8")
+            return json.dumps({"choices": [{"message": {"content": "{}"}}]}).encode("utf-8")
 
     def fake_urlopen(req, timeout):
         captured["url"] = req.full_url
         captured["timeout"] = timeout
-        captured["auth"] = req.headers.get("Authorization")
-        payload = json.loads(req.data.decode("utf-8"))
-        captured["payload"] = payload
         return DummyResp()
 
+    monkeypatch.setattr(llm.urllib.request, "getproxies", lambda: {"https": "http://proxy:8080"})
     monkeypatch.setattr(llm.urllib.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(llm, "_OPENAI_CLIENT", None)
 
-    out = llm.openai_chat_json("system", "user", model="gpt-4.1-mini", api_key="key")
+    assert llm.openai_chat_json("system", "user", api_key="key") == {}
+    assert captured == {"url": "https://api.openai.com/v1/chat/completions", "timeout": 120}
 
-    assert out == {"ok": True}
-    assert captured["url"] == "https://api.openai.com/v1/chat/completions"
-    assert captured["timeout"] == 120
-    assert captured["auth"] == "Bearer key"
-    assert captured["payload"]["model"] == "gpt-4.1-mini"
 
+def test_openai_chat_json_sends_compact_utf8_body(monkeypatch):
+    log, _opened = _install_fake_client(monkeypatch, [_ok_response({"ok": True})])
 
-def test_openai_chat_json_retries_without_temperature_when_unsupported(monkeypatch):
-    seen_payloads = []
+    out = llm.openai_chat_json("system", "caf\u00e9 tab", model="gpt-4.1-mini", api_key="key")
 
-    class DummyResp:
-        def __enter__(self):
-            return self
+    assert out == {"ok": True}
+    data = log[0]["body"]
+    assert b'"role":"user"' in data
+    assert "caf\u00e9 tab".encode("utf-8") in data
+    assert json.loads(data)["messages"][1]["content"] == "caf\u00e9 tab"
 
-        def __exit__(self, *_args):
-            return False
 
-        def read(self):
-            body = {
-                "choices": [
-                    {
-                        "message": {
-                            "content": json.dumps({"ok": True}),
-                        }
-                    }
-                ]
+def test_openai_chat_json_retries_without_temperature_when_unsupported(monkeypatch):
+    error_body = json.dumps(
+        {
+            "error": {
+                "message": "Unsupported value: 'temperature'",
+                "param": "temperature",
+                "code": "unsupported_value",
             }
-            return json.dumps(body).encode("utf-8")
-
-    def fake_urlopen(req, timeout):
-        payload = json.loads(req.data.decode("utf-8"))
-        seen_payloads.append(payload)
-        if len(seen_payloads) == 1:
-            body = json.dumps(
-                {
-                    "error": {
-                        "message": "Unsupported value: 'temperature'",
-                        "param": "temperature",
-                        "code": "unsupported_value",
-                    }
-                }
-            ).encode("utf-8")
-            raise urllib.error.HTTPError(
-                req.full_url,
-                400,
-                "Bad Request",
-                hdrs=None,
-                fp=BytesIO(body),
-            )
-        return DummyResp()
-
-    monkeypatch.setattr(llm.urllib.request, "urlopen", fake_urlopen)
+        }
+    ).encode("utf-8")
+    log, _opened = _install_fake_client(
+        monkeypatch,
+        [FakeHTTPResponse(400, error_body), _ok_response({"ok": True})],
+    )
 
     out = llm.openai_chat_json("system", "user", model="gpt-5-mini", api_key="key")
 
+    seen_payloads = [json.loads(entry["body"].decode("utf-8")) for entry in log]
     assert out == {"ok": True}
     assert len(seen_payloads) == 2
     assert "temperature" in seen_payloads[0]
@@ -162,25 +246,16 @@ def test_openai_chat_json_retries_without_temperature_when_unsupported(monkeypat
 
 
 def test_openai_chat_json_surfaces_http_error_details(monkeypatch):
-    def fake_urlopen(req, timeout):
-        body = json.dumps(
-            {
-                "error": {
-                    "message": "Invalid request field",
-                    "param": "messages",
-                    "code": "invalid_request_error",
-                }
+    body = json.dumps(
+        {
+            "error": {
+                "message": "Invalid request field",
+                "param": "messages",
+                "code": "invalid_request_error",
             }
-        ).encode("utf-8")
-        raise urllib.error.HTTPError(
-            req.full_url,
-            400,
-            "Bad Request",
-            hdrs=None,
-            fp=BytesIO(body),
-        )
-
-    monkeypatch.setattr(llm.urllib.request, "urlopen", fake_urlopen)
+        }
+    ).encode("utf-8")
+    _install_fake_client(monkeypatch, [FakeHTTPResponse(400, body)])
 
     with pytest.raises(RuntimeError) as exc:
         llm.openai_chat_json("system", "user", model="gpt-4.1-mini", api_key="key")
@@ -191,8 +266,9 @@ def test_openai_chat_json_surfaces_http_error_details(monkeypatch):
 
 
 def test_chunked_respects_size():
-    assert llm.chunked([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
-    assert llm.chunked([1, 2], 0) == [[1, 2]]
+    assert list(llm.chunked([1, 2, 3, 4, 5], 2)) == [[1, 2], [3, 4], [5]]
+    assert list(llm.chunked([1, 2], 0)) == [[1, 2]]
+    assert list(llm.chunked(iter(range(3)), 2)) == [[0, 1], [2]]
 
 
 def test_call_with_retries_retries_then_succeeds(monkeypatch):
@@ -214,10 +290,9 @@ def test_call_with_retries_retries_then_succeeds(monkeypatch):
     assert sleeps == [2.0, 4.0]
 
 
-def test_classify_with_llm_maps_by_id_and_url_with_redaction_and_max_items():
+def test_classify_with_llm_maps_by_id_with_redaction_and_max_items():
     items = [_item(0), _item(1), _item(2)]
     indexed = list(enumerate(items))
-    url_to_idx = {it.norm_url: idx for idx, it in indexed}
 
     seen = {}
 
@@ -227,13 +302,13 @@ def test_classify_with_llm_maps_by_id_and_url_with_redaction_and_max_items():
         return {
             "items": [
                 {"id": "1", "topic": "alpha", "kind": "repo", "action": "build", "score": 5},
-                {"url": items[0].clean_url, "topic": "beta", "kind": "docs", "action": "read", "score": 4},
+                {"id": 0, "topic": "beta", "kind": "docs", "action": "read", "score": 4},
+                {"id": 2, "topic": "gamma", "kind": "docs", "action": "read", "score": 4},
             ]
         }
 
     cls = llm.classify_with_llm(
         indexed_for_cls=indexed,
-        url_to_idx=url_to_idx,
         api_key="k",
         max_items=2,
         chunk_size=50,
@@ -248,8 +323,10 @@ def test_classify_with_llm_maps_by_id_and_url_with_redaction_and_max_items():
     assert f"- kind: one of [{', '.join(POSTPROCESS_KIND_ORDER)}]" in seen["user"]
     assert f"- action: one of [{', '.join(POSTPROCESS_ACTION_ORDER)}]" in seen["user"]
     assert "Action rubric (choose enum only; do not use synonyms):" in seen["user"]
+    assert "id is mandatory" in seen["user"]
     assert cls[1]["kind"] == "repo"
     assert cls[0]["kind"] == "docs"
+    assert 2 not in cls
 
 
 def test_classify_with_llm_logs_and_continues_on_chunk_failure():
@@ -258,7 +335,6 @@ def test_classify_with_llm_logs_and_continues_on_chunk_failure():
 
     cls = llm.classify_with_llm(
         indexed_for_cls=[(0, item)],
-        url_to_idx={item.norm_url: 0},
         api_key="k",
         call_with_retries_fn=lambda *_args, **_kwargs: (_ for _ in ()).throw(RuntimeError("bad")),
         stderr=stderr,
@@ -274,7 +350,6 @@ def test_classify_with_llm_logs_chunk_validation_diagnostics():
 
     cls = llm.classify_with_llm(
         indexed_for_cls=[(0, item)],
-        url_to_idx={item.norm_url: 0},
         api_key="k",
         call_with_retries_fn=lambda *_args, **_kwargs: {
             "items": [
@@ -291,3 +366,133 @@ def test_classify_with_llm_logs_chunk_validation_diagnostics():
     assert "invalid_kind=1" in output
     assert "invalid_action=1" in output
     assert "invalid_item_id=1" in output
+
+
+def test_classify_with_llm_rejects_ids_outside_chunk_and_url_only_echoes():
+    items = [_item(0), _item(1)]
+    stderr = StringIO()
+
+    cls = llm.classify_with_llm(
+        indexed_for_cls=list(enumerate(items)),
+        api_key="k",
+        redact_llm=False,
+        call_with_retries_fn=lambda *_args, **_kwargs: {
+            "items": [
+                {"id": 99, "topic": "x", "kind": "docs", "action": "read"},
+                {"url": items[1].clean_url, "topic": "y", "kind": "repo", "action": "build"},
+                {"id": 0, "topic": "z", "kind": "docs", "action": "read"},
+            ]
+        },
+        stderr=stderr,
+    )
+
+    assert list(cls) == [0]
+    assert cls[0]["topic"] == "z"
+    assert "invalid_item_id=2" in stderr.getvalue()
+
+
+def test_classify_with_llm_parallel_chunks_merge_like_serial():
+    items = [_item(i) for i in range(7)]
+    indexed = list(enumerate(items))
+
+    def fake_call(system, user, api_key):
+        ids = [int(line.split(" | ", 1)[0][2:]) for line in user.splitlines() if line.startswith("- ") and " | " in line]
+        return {"items": [{"id": idx, "topic": f"t{idx}", "kind": "docs", "action": "read"} for idx in ids]}
+
+    serial = llm.classify_with_llm(indexed, "k", chunk_size=2, call_with_retries_fn=fake_call)
+    stderr = StringIO()
+    pooled = llm.classify_with_llm(
+        indexed,
+        "k",
+        chunk_size=2,
+        call_with_retries_fn=fake_call,
+        parallel=3,
+        stderr=stderr,
+    )
+
+    assert pooled == serial
+    assert sorted(pooled) == list(range(7))
+    assert stderr.getvalue().count("LLM classify chunk diagnostics:") == 4
+
+
+def test_classify_with_llm_single_chunk_skips_thread_pool(monkeypatch):
+    item = _item(0)
+
+    def no_pool(*_args, **_kwargs):
+        raise AssertionError("a single chunk should not start a thread pool")
+
+    monkeypatch.setattr(llm, "ThreadPoolExecutor", no_pool)
+    cls = llm.classify_with_llm(
+        [(0, item)],
+        "k",
+        call_with_retries_fn=lambda **_kwargs: {"items": [{"id": 0, "topic": "t", "kind": "docs", "action": "read"}]},
+        parallel=8,
+    )
+
+    assert cls[0]["topic"] == "t"
+
+
+def test_request_rate_limiter_spaces_requests():
+    now = {"t": 100.0}
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        now["t"] += seconds
+
+    limiter = llm.RequestRateLimiter(120, clock=lambda: now["t"], sleep=fake_sleep)
+    for _ in range(3):
+        limiter.acquire()
+
+    assert sleeps == [0.5, 0.5]
+    llm.RequestRateLimiter(0, sleep=lambda _s: (_ for _ in ()).throw(AssertionError("no sleep"))).acquire()
+
+
+def test_classify_with_llm_packs_chunks_under_token_budget():
+    items = [_item(i) for i in range(6)]
+    users = []
+
+    def fake_call(system, user, api_key):
+        users.append(user)
+        return {"items": [{"id": idx, "topic": "t", "kind": "docs", "action": "read"} for idx in range(6)]}
+
+    cls = llm.classify_with_llm(
+        list(enumerate(items)),
+        "k",
+        chunk_size=1,
+        max_request_tokens=50,
+        call_with_retries_fn=fake_call,
+    )
+
+    assert 1 < len(users) < 6
+    assert sorted(cls) == list(range(6))
+    assert sum(user.count("| example.com") for user in users) == 6
+
+
+def test_pack_chunks_keeps_chunks_when_budget_disabled():
+    chunk_lines = [([(0, _item(0))], ["- 0 | a"]), ([(1, _item(1))], ["- 1 | b"])]
+
+    assert llm._pack_chunks(chunk_lines, 0) == chunk_lines
+    packed = llm._pack_chunks(chunk_lines, 1000)
+    assert len(packed) == 1
+    assert [idx for idx, _ in packed[0][0]] == [0, 1]
+    assert packed[0][1] == ["- 0 | a", "- 1 | b"]
+    # Packing builds new lists; the input chunks are left untouched.
+    assert chunk_lines[0] == ([(0, chunk_lines[0][0][0][1])], ["- 0 | a"])
+
+
+def test_request_rate_limiter_budgets_tokens_per_minute():
+    now = {"t": 0.0}
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        now["t"] += seconds
+
+    limiter = llm.RequestRateLimiter(tokens_per_minute=6000, clock=lambda: now["t"], sleep=fake_sleep)
+    limiter.acquire(3000)
+    limiter.acquire(100)
+    limiter.acquire(0)
+
+    assert sleeps == [30.0]
+    assert now["t"] == 30.0
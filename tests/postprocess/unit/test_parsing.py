@@ -4,7 +4,11 @@ from core.postprocess.parsing import (
     extract_created_ts,
     extract_frontmatter_value,
     extract_items,
+    extract_items_from_lines,
+    frontmatter_value_from_lines,
+    iter_source_lines,
     parse_markdown_link_line,
+    read_head_lines,
 )
 
 
@@ -29,6 +33,49 @@ def test_parse_markdown_link_line_rejects_malformed_markdown():
     assert parse_markdown_link_line("just text") is None
 
 
+def test_parse_markdown_link_line_fast_path_edge_cases():
+    cases = {
+        "  - [Indented](https://example.com/i)  ": ("Indented", "https://example.com/i"),
+        "- [\tTab\t](\thttps://x.test\t)": ("Tab", "https://x.test"),
+        "- [\u00a0Nbsp\u00a0](\u00a0https://x.test\u00a0)": ("Nbsp", "https://x.test"),
+        "- [T]\t(https://x.test)": ("T", "https://x.test"),
+        "- [T](https://x.test/a b)": ("T", "https://x.test/a b"),
+        "- [a\\]b](https://x.test)": ("a]b", "https://x.test"),
+        "- [T](https://x.test\\))": ("T", "https://x.test)"),
+        "- [T](https://x.test))": None,
+        "- [ ](https://x.test)": None,
+        "- [T]()": None,
+        "- [T](u": None,
+        "-[T](https://x.test)": None,
+    }
+    for line, expected in cases.items():
+        assert parse_markdown_link_line(line) == expected, line
+
+
+def test_parse_markdown_link_line_plain_links_skip_regex(monkeypatch):
+    from core.postprocess import parsing
+
+    class _NoRegex:
+        def fullmatch(self, _line):
+            raise AssertionError("regex should not run for plain links")
+
+    monkeypatch.setattr(parsing, "SIMPLE_LINK_RE", _NoRegex())
+
+    assert parse_markdown_link_line("- [ Example ] ( https://example.com/x )") == ("Example", "https://example.com/x")
+    assert parse_markdown_link_line("- [](https://example.com)") is None
+
+
+def test_parse_markdown_link_line_handles_escapes_without_scanner(monkeypatch):
+    from core.postprocess import parsing
+
+    monkeypatch.setattr(parsing, "_parse_markdown_link_scan", lambda _line: (_ for _ in ()).throw(AssertionError))
+
+    assert parse_markdown_link_line(r"- [Array \[0\] docs](https://example.com/a\(1\))") == (
+        "Array [0] docs",
+        "https://example.com/a(1)",
+    )
+
+
 def test_extract_items_tracks_browser_and_ignores_window_headings():
     md = (
         "## Chrome\n"
@@ -49,6 +96,23 @@ def test_extract_items_tracks_browser_and_ignores_window_headings():
     assert items[0].clean_url == "https://example.com/a"
 
 
+def test_extract_items_dispatch_keeps_indented_links_and_heading_prefixes():
+    md = (
+        "# TabDump\n"
+        "## Chrome (2 windows)\n"
+        "  - [Indented](https://example.com/a)\n"
+        "\t- [Tabbed](https://example.com/b)\n"
+        "text - [Not a link line](https://example.com/c)\n"
+        "## Other\n"
+        "- [Still chrome](https://example.com/d)\n"
+    )
+
+    items = extract_items(md)
+
+    assert [item.title for item in items] == ["Indented", "Tabbed", "Still chrome"]
+    assert {item.browser for item in items} == {"chrome"}
+
+
 def test_extract_items_uses_injected_url_functions():
     md = "## Chrome\n- [T](https://example.com/path?q=1)\n"
 
@@ -94,8 +158,40 @@ def test_extract_frontmatter_value_reads_only_frontmatter_block(tmp_path: Path):
     assert extract_frontmatter_value(path, "tabdump_id") == "abc-123"
 
 
+def test_read_head_lines_matches_splitlines_and_stops_early(tmp_path: Path):
+    path = tmp_path / "dump.md"
+    text = "---\r\ncreated: 2026-02-07 00-00-00\x0cnext\n---\n" + "- [T](https://example.com)\n" * 1000
+    path.write_bytes(text.encode("utf-8") + b"\xff")
+
+    expected = path.read_text(encoding="utf-8", errors="replace").splitlines()
+    assert read_head_lines(path, 4) == expected[:4]
+    assert read_head_lines(path, 5000) == expected
+
+
 def test_extract_frontmatter_value_returns_none_without_frontmatter(tmp_path: Path):
     path = tmp_path / "dump.md"
     path.write_text("tabdump_id: abc-123\n", encoding="utf-8")
 
     assert extract_frontmatter_value(path, "tabdump_id") is None
+
+
+def test_streamed_file_lines_match_in_memory_parsing(tmp_path: Path):
+    text = (
+        "---\r\n"
+        "tabdump_id: \"abc\"\r\n"
+        "---\r\n"
+        "## Chrome\r\n"
+        "- [One](https://example.com/a)\r\n"
+        "\r\n"
+        "- [Two](https://example.com/b)"
+    )
+    path = tmp_path / "dump.md"
+    path.write_bytes(text.encode("utf-8"))
+
+    with path.open("r", encoding="utf-8", errors="replace") as handle:
+        head = [next(handle) for _ in range(3)]
+        assert frontmatter_value_from_lines(head, "tabdump_id") == "abc"
+        streamed = extract_items_from_lines(iter_source_lines(head + list(handle)))
+
+    assert streamed == extract_items(text)
+    assert [item.title for item in streamed] == ["One", "Two"]
@@ -15,6 +15,19 @@ def test_redact_text_for_llm_redacts_sensitive_keys_and_truncates():
     assert out.endswith("...")
 
 
+def test_redact_text_for_llm_ascii_and_unicode_edge_cases():
+    cases = {
+        "TOKEN = abc&x": "TOKEN=[REDACTED]&x",
+        "api-key:\x1cvalue": "api-key=[REDACTED]",
+        "xsig=1 sig=2": "xsig=1 sig=[REDACTED]",
+        "caf\u00e9token=abc": "caf\u00e9token=abc",
+        "\u017fig=abc": "\u017fig=[REDACTED]",
+        "session:\u00a0abc": "session=[REDACTED]",
+    }
+    for text, expected in cases.items():
+        assert redact_text_for_llm(text) == expected, text
+
+
 def test_redact_url_for_llm_redacts_query_values_by_default():
     out = redact_url_for_llm("https://example.com/cb?token=abc&foo=bar")
 
@@ -28,3 +41,14 @@ def test_redact_url_for_llm_can_preserve_query_when_disabled():
 
 def test_redact_url_for_llm_returns_non_network_values_unchanged():
     assert redact_url_for_llm("just-a-value") == "just-a-value"
+
+
+def test_redaction_helpers_memoize_repeat_inputs():
+    from core.postprocess import redaction
+
+    redaction.clear_caches()
+    url = "https://example.com/cb?token=abc"
+    first = redact_url_for_llm(url)
+    assert redact_url_for_llm(url) == first == "https://example.com/cb?token=REDACTED"
+    assert redact_url_for_llm(url, redact_query=False) == "https://example.com/cb?token=abc"
+    assert redaction.redact_url_for_llm.cache_info().hits == 1
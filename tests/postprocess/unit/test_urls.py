@@ -1,11 +1,15 @@
+import ipaddress
+
 from core.postprocess.urls import (
     default_kind_action,
     domain_of,
     host_matches_base,
     is_private_or_loopback_host,
     is_sensitive_url,
+    kind_action_for_reason,
     matches_sensitive_host_or_path,
     normalize_url,
+    sensitive_url_reason,
 )
 
 
@@ -17,6 +21,35 @@ def test_normalize_url_strips_trackers_and_fragment_and_sorts_query():
     assert out == "https://example.com/path?a=1&b=2"
 
 
+def test_normalize_url_fast_path_edge_cases():
+    cases = {
+        "HTTPS://Example.com": "https://example.com/",
+        "https://example.com/a/b/": "https://example.com/a/b",
+        "http://User@Host.Example:8080/P?#frag": "http://user@host.example:8080/P",
+        "https://example.com//": "https://example.com/",
+        "https://example.com/x#a#b": "https://example.com/x",
+    }
+    for url, expected in cases.items():
+        assert normalize_url(url) == expected, url
+
+
+def test_normalize_url_canonical_query_edge_cases():
+    cases = {
+        "a=1&b=2": "a=1&b=2",
+        "a=&b=x.y~z": "a=&b=x.y~z",
+        "b=2&a=1": "a=1&b=2",
+        "a=1&UTM_medium=x": "a=1",
+        "a=1&fbclid=z": "a=1",
+        "a=1&a=0": "a=0&a=1",
+        "q=a+b&r=%41": "q=a+b&r=A",
+        "a&b=1": "a=&b=1",
+        "a=b=c": "a=b%3Dc",
+    }
+    for query, expected in cases.items():
+        assert normalize_url(f"https://example.com/p?{query}") == f"https://example.com/p?{expected}", query
+    assert normalize_url("https://example.com/p?utm_source=x") == "https://example.com/p"
+
+
 def test_normalize_url_keeps_non_network_values_as_is():
     assert normalize_url("example.com/path") == "example.com/path"
 
@@ -47,6 +80,40 @@ def test_matches_sensitive_host_or_path_honors_host_and_path_markers():
     assert not matches_sensitive_host_or_path("github.com", "/openai/openai-python", markers)
 
 
+def test_matches_sensitive_host_or_path_edge_cases():
+    markers = ["github.com/settings", " Auth.Example.com ", "/orphan-path", "", "b/"]
+    cases = {
+        ("github.com", "/settings/x"): True,
+        ("x.github.com", "/Settings"): True,
+        ("github.com", "/other"): False,
+        ("xgithub.com", "/settings"): False,
+        ("auth.example.com", ""): True,
+        ("a.auth.example.com", "/x"): True,
+        ("a.b", "/x"): True,
+        ("b", ""): False,
+        ("", "/orphan-path"): False,
+        ("", ""): False,
+    }
+    for (host, path), expected in cases.items():
+        assert matches_sensitive_host_or_path(host, path, markers) is expected, (host, path)
+
+
+def test_is_private_or_loopback_host_skips_ip_parse_for_names(monkeypatch):
+    parsed = []
+    real_ip_address = ipaddress.ip_address
+    monkeypatch.setattr(ipaddress, "ip_address", lambda host: parsed.append(host) or real_ip_address(host))
+
+    assert not is_private_or_loopback_host("site10.example.com")
+    assert not is_private_or_loopback_host("docs.python.org")
+    assert parsed == []
+
+    assert not is_private_or_loopback_host("1.2.3")
+    assert is_private_or_loopback_host("192.168.1.2")
+    assert is_private_or_loopback_host("fe80::1")
+    assert not is_private_or_loopback_host("8.8.8.8")
+    assert parsed == ["1.2.3", "192.168.1.2", "fe80::1", "8.8.8.8"]
+
+
 def test_is_sensitive_url_detects_auth_query_and_private_hosts():
     assert is_sensitive_url("https://example.com/login")
     assert is_sensitive_url("https://example.com/cb?token=abc")
@@ -65,12 +132,88 @@ def test_default_kind_action_returns_expected_defaults():
     assert default_kind_action("https://example.com/path") == ("misc", "triage")
 
 
+def test_sensitive_url_reason_reports_triggering_condition():
+    assert sensitive_url_reason("file:///tmp/x") == "file_scheme"
+    assert sensitive_url_reason("about:blank") == "missing_host"
+    assert sensitive_url_reason("http://localhost:3000/admin") == "private_host"
+    assert sensitive_url_reason("https://example.com/login") == "auth_path_hint"
+    assert sensitive_url_reason("https://accounts.google.com/u/0") == "sensitive_host_match"
+    assert sensitive_url_reason("https://example.com/cb?token=abc") == "sensitive_query_key"
+    assert sensitive_url_reason("ftp://example.com/path") == "non_http_scheme"
+    assert sensitive_url_reason("https://docs.python.org/3/tutorial/") is None
+
+
+def test_sensitive_query_key_regex_agrees_with_decoded_keys():
+    cases = {
+        "https://example.com/cb?Token=abc": "sensitive_query_key",
+        "https://example.com/cb?a=1&%20code%20=x": "sensitive_query_key",
+        "https://example.com/cb?a=1&+sig&b": "sensitive_query_key",
+        "https://example.com/cb?x=1& session": "sensitive_query_key",
+        "https://example.com/cb?mytoken=1&token_type=x": None,
+        "https://example.com/cb?q=token&b=code": None,
+        "https://example.com/cb?x=1#token=abc": None,
+    }
+    for url, expected in cases.items():
+        assert sensitive_url_reason(url) == expected, url
+        assert sensitive_url_reason(url, sensitive_query_keys=["token", "code", "sig", "session"]) == expected, url
+
+    assert sensitive_url_reason("https://example.com/cb?a=b", sensitive_query_keys=["a=b"]) is None
+    assert sensitive_url_reason("https://example.com/cb?x=1", sensitive_query_keys=[]) is None
+    assert sensitive_url_reason("https://example.com/login", auth_path_hints=()) is None
+
+
+def test_kind_action_for_reason_maps_each_reason():
+    cases = {
+        "file_scheme": ("local", "ignore"),
+        "missing_host": ("internal", "ignore"),
+        "private_host": ("local", "ignore"),
+        "auth_path_hint": ("auth", "ignore"),
+        "sensitive_host_match": ("auth", "ignore"),
+        "sensitive_query_key": ("auth", "ignore"),
+        "non_http_scheme": ("internal", "ignore"),
+        None: ("misc", "triage"),
+    }
+    for reason, expected in cases.items():
+        assert kind_action_for_reason(reason) == expected, reason
+    assert kind_action_for_reason("unknown_reason") == ("internal", "ignore")
+
+
 def test_url_helpers_fail_closed_when_urlsplit_raises(monkeypatch):
     import core.postprocess.urls as urls
 
     monkeypatch.setattr(urls.urllib.parse, "urlsplit", lambda _value: (_ for _ in ()).throw(ValueError("boom")))
+    urls.clear_caches()
+    try:
+        assert normalize_url("https://example.com/path") == "https://example.com/path"
+        assert domain_of("https://example.com/path") == "(unknown)"
+        assert is_sensitive_url("https://example.com/path") is True
+        assert default_kind_action("https://example.com/path") == ("internal", "ignore")
+        assert sensitive_url_reason("https://example.com/path") == "unparseable"
+    finally:
+        urls.clear_caches()
+
+
+def test_url_helpers_memoize_default_calls():
+    import core.postprocess.urls as urls
+
+    urls.clear_caches()
+    url = "https://example.com/memo?b=2&a=1"
+    assert normalize_url(url) == normalize_url(url) == "https://example.com/memo?a=1&b=2"
+    assert is_sensitive_url(url) is False
+    assert is_sensitive_url(url, sensitive_hosts={"example.com"}) is True
+    assert urls.normalize_url.cache_info().hits >= 1
+    assert urls._default_sensitive_url_reason.cache_info().currsize == 1
+
+
+def test_split_url_is_shared_by_domain_and_sensitivity_checks():
+    import core.postprocess.urls as urls
 
-    assert normalize_url("https://example.com/path") == "https://example.com/path"
-    assert domain_of("https://example.com/path") == "(unknown)"
-    assert is_sensitive_url("https://example.com/path") is True
-    assert default_kind_action("https://example.com/path") == ("internal", "ignore")
+    urls.clear_caches()
+    url = "https://example.com/shared?x=1"
+    assert domain_of(url) == "example.com"
+    assert sensitive_url_reason(url) is None
+    info = urls.split_url.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+    assert urls.split_url(url) is urls.split_url(url)
+    urls.clear_caches()
+    assert urls.split_url.cache_info().currsize == 0
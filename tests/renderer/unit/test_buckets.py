@@ -39,6 +39,9 @@ def _item(**overrides):
 def test_looks_like_repo_path():
     assert _looks_like_repo_path("/org/repo") is True
     assert _looks_like_repo_path("/org") is False
+    assert _looks_like_repo_path("//org//") is False
+    assert _looks_like_repo_path("org//repo/") is True
+    assert _looks_like_repo_path("") is False
 
 
 def test_is_project_workspace_handles_trello_notion_and_generic_hints():
@@ -143,3 +146,35 @@ def test_assign_buckets_drops_overflow_when_backlog_overflow_disabled():
 
     assert len(buckets["QUICK"]) == 1
     assert buckets["BACKLOG"] == []
+
+
+def test_quick_keyword_patterns_match_substrings_inside_words():
+    from core.renderer import buckets
+
+    cases = {
+        "": (False, False),
+        "watchtower https://example.com": (True, False),
+        "free shipping https://shop.test/x": (False, True),
+        "прайс сезонный https://example.com": (True, False),
+        "the order of things https://example.com": (False, True),
+        "nothing here https://example.com": (False, False),
+    }
+    for blob, (leisure, shopping) in cases.items():
+        assert (buckets._LEISURE_KEYWORD_RE.search(blob) is not None) is leisure, blob
+        assert (buckets._SHOPPING_KEYWORD_RE.search(blob) is not None) is shopping, blob
+
+
+def test_assign_buckets_resolves_project_opts_once(monkeypatch):
+    from core.renderer import buckets
+
+    calls = []
+    real_project_opts = buckets._project_opts
+    monkeypatch.setattr(buckets, "_project_opts", lambda cfg: calls.append(cfg) or real_project_opts(cfg))
+    items = [
+        _item(url=f"https://trello.com/b/{i}", domain="trello.com", path=f"/b/{i}", kind="misc") for i in range(5)
+    ]
+
+    out = _assign_buckets(items, _cfg())
+
+    assert len(calls) == 1
+    assert len(out["PROJECTS"]) == 5
@@ -1,6 +1,15 @@
 from urllib.parse import urlparse
 
-from core.renderer.classify import _classify_domain, _contains_any, _derive_kind, _matches_any_regex
+from core.renderer.classify import (
+    _classify_domain,
+    _classify_opts,
+    _contains_any,
+    _derive_kind,
+    _host_category,
+    _matches_any_regex,
+    _query_has_any_key,
+    _search_patterns,
+)
 from core.renderer.config import DEFAULT_CFG
 
 
@@ -30,6 +39,25 @@ def test_contains_any_and_regex_helpers_are_resilient():
     assert _matches_any_regex("/login", [r"("]) is False
 
 
+def test_classify_opts_compile_cfg_patterns_once_for_many_items(monkeypatch):
+    from core.renderer import classify
+
+    calls = []
+    real_compile = classify.re.compile
+    monkeypatch.setattr(classify.re, "compile", lambda rx, *args: calls.append(rx) or real_compile(rx, *args))
+
+    cfg = _cfg(authPathRegex=[r"(", r"/sign-?in", r"(?i)/LOGIN"])
+    opts = _classify_opts(cfg)
+    compiled = list(calls)
+    urls = ["https://example.com/signin", "https://example.com/Login", "https://example.com/home"]
+    categories = [_classify_domain(url, urlparse(url), "example.com", {}, cfg, url.lower(), opts) for url in urls * 3]
+
+    assert calls == compiled
+    assert "(?:/sign-?in)|(?i:/LOGIN)" in compiled
+    assert categories == [_classify(url, cfg=cfg) for url in urls] * 3
+    assert categories[:3] == ["admin_auth", "admin_auth", "generic"]
+
+
 def test_classify_domain_admin_paths():
     assert _classify("file:///tmp/a.txt", flags={"is_local": False}) == "admin_local"
     assert _classify("chrome://settings", cfg=_cfg(skipPrefixes=["chrome://"])) == "admin_internal"
@@ -62,3 +90,54 @@ def test_derive_kind_prioritizes_provided_and_domain_fallbacks():
     assert _derive_kind("code_host", "", "https://github.com/openai/gpt") == "repo"
     assert _derive_kind("docs_site", "", "https://example.com/docs") == "docs"
     assert _derive_kind("generic", "", "https://example.com") == "article"
+
+
+def test_query_has_any_key_decodes_key_names_only():
+    assert _query_has_any_key("x=1&Sig%6Eature=abc", ["signature"])
+    assert _query_has_any_key("access+token=1", [" Access Token "])
+    assert not _query_has_any_key("q=token", ["token"])
+    assert not _query_has_any_key("token=1", [])
+    assert _query_has_any_key("token=1", [["unhashable"], "token"])
+
+
+def test_host_category_keeps_group_order_over_specificity():
+    groups = (
+        ("code_host", ["example.com"]),
+        ("music", ["music.example.com", "example.com"]),
+        ("video", ["tv"]),
+    )
+    assert _host_category("music.example.com", groups) == "code_host"
+    assert _host_category(" Clips.TV ", groups) == "video"
+    assert _host_category("example.org", groups) == ""
+    assert _host_category("", groups) == ""
+
+
+def test_classify_and_derive_kind_accept_precomputed_lower_url():
+    url = "https://Example.com/Paper.PDF"
+    parsed = urlparse(url)
+    category = _classify_domain(url, parsed, "example.com", {}, _cfg(), url.lower())
+    assert category == _classify_domain(url, parsed, "example.com", {}, _cfg())
+    assert _derive_kind(category, "", url, url.lower()) == _derive_kind(category, "", url) == "paper"
+    assert _classify("https://intranet.example/x", cfg=_cfg(skipPrefixes=["HTTPS://Intranet."])) == "admin_internal"
+
+
+def test_matches_any_regex_merges_auth_patterns_into_one_alternation():
+    patterns = DEFAULT_CFG["authPathRegex"]
+    assert len(_search_patterns(tuple(patterns))) == 1
+    for path in ["/LOGIN", "/a/oauth/cb", "/settings/api-keys"]:
+        assert _matches_any_regex(path, patterns) is True, path
+    for path in ["/blogin", "/docs"]:
+        assert _matches_any_regex(path, patterns) is False, path
+
+    # Back-references keep per-pattern matching so group numbers stay local.
+    backref = ("(a)\\1", "(b)\\1")
+    assert len(_search_patterns(backref)) == 2
+    assert _matches_any_regex("bb", backref)
+
+
+def test_contains_any_alternation_edge_cases():
+    assert _contains_any("https://example.com/docs/x", ["/DOCS/", "/blog/"]) is True
+    assert _contains_any("https://example.com/a.b", ["a.b"]) is True
+    assert _contains_any("https://example.com/axb", ["a.b", "(", "[x]"]) is False
+    assert _contains_any("anything", [""]) is True
+    assert _contains_any("anything", []) is False
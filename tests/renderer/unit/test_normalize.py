@@ -1,11 +1,19 @@
+import re
+
+import pytest
+
 from core.renderer.config import DEFAULT_CFG
 from core.renderer.normalize import (
     _canonical_title,
+    _canonical_title_opts,
+    _canonical_title_with,
     _github_repo_slug_title,
     _normalize_flags,
     _normalize_intent,
     _normalize_items,
     _normalize_title,
+    _strip_suffixes,
+    _suffix_tuple,
     _truncate,
 )
 
@@ -16,6 +24,19 @@ def test_normalize_title_and_truncate():
     assert truncated == "abcd\u2026"
 
 
+def test_normalize_title_collapses_unicode_whitespace():
+    cases = {
+        "": "",
+        " \r\n ": "",
+        "a\r\rb": "a b",
+        "a\u00a0\u2003b\x1c c": "a b c",
+        "\u3000tab\vtitle\f": "tab title",
+        "x\u200by": "x\u200by",
+    }
+    for title, expected in cases.items():
+        assert _normalize_title(title) == expected, title
+
+
 def test_github_repo_slug_title_prefers_slug_for_long_titles():
     slug = _github_repo_slug_title("/openai/gpt/issues/1", "GitHub - this is a long enough title to trigger slug")
     assert slug == "openai/gpt \u2014 issues"
@@ -55,6 +76,24 @@ def test_canonical_title_obeys_disable_flag():
     assert _canonical_title("  My Title  ", "example.com", "/", cfg) == "  My Title  "
 
 
+def test_canonical_title_strips_prefix_regexes_with_cached_patterns():
+    cfg = dict(DEFAULT_CFG)
+    assert _canonical_title("(3) Inbox title", "example.com", "/", cfg) == "Inbox title"
+    assert _canonical_title("(12) Another one", "example.com", "/", cfg) == "Another one"
+
+    cfg["canonicalTitleStripPrefixesRegex"] = ["("]
+    with pytest.raises(re.error):
+        _canonical_title("Title", "example.com", "/", cfg)
+
+
+def test_strip_suffixes_keeps_list_order_semantics():
+    # List order wins over length: "b" strips first, so "ab" no longer matches.
+    assert _strip_suffixes("xab", _suffix_tuple(("b", "ab"))) == "xa"
+    assert _strip_suffixes("Page - Site - Site", _suffix_tuple((" - Site",))) == "Page"
+    assert _strip_suffixes("Page", _suffix_tuple(("", " - Site"))) == "Page"
+    assert _strip_suffixes("Page - Site", ()) == "Page - Site"
+
+
 def test_normalize_items_dedupes_and_derives_fields():
     cfg = dict(DEFAULT_CFG)
     cfg["titleMaxLen"] = 20
@@ -95,3 +134,35 @@ def test_normalize_items_dedupes_and_derives_fields():
     assert second["title"] == "spaced title"
     assert second["flags"]["is_local"] is True
     assert second["kind"] == "admin"
+
+
+def test_canonical_title_opts_resolve_cfg_once():
+    cfg = dict(DEFAULT_CFG)
+    opts = _canonical_title_opts(cfg)
+    for title, host in [("(2) Page | GitHub", "github.com"), ("Plain title", "example.com")]:
+        assert _canonical_title_with(title, host, "/", opts) == _canonical_title(title, host, "/", cfg)
+
+    cfg["canonicalTitleEnabled"] = False
+    assert _canonical_title_with(" raw ", "example.com", "/", _canonical_title_opts(cfg)) == " raw "
+
+
+def test_canonical_title_fast_path_only_caps_length_for_untouched_titles():
+    cfg = dict(DEFAULT_CFG)
+    cfg["canonicalTitleMaxLen"] = 10
+    opts = _canonical_title_opts(cfg)
+    for title, host in [("Plain long title here", "example.com"), ("(2) Inbox", "example.com"), ("Repo - GitHub", "github.com")]:
+        fast = _canonical_title_with(title, host, "/", opts, title_is_normalized=True)
+        assert fast == _canonical_title_with(title, host, "/", opts)
+    assert _canonical_title_with("Plain long title here", "example.com", "/", opts, title_is_normalized=True) == "Plain lon…"
+
+
+def test_normalize_items_interns_repeated_small_fields():
+    raw = [
+        {"url": f"https://example.com/{i}", "title": f"T{i}", "browser": "Chrome", "kind": "Docs",
+         "intent": {"action": "read", "confidence": 0.9}}
+        for i in range(2)
+    ]
+    first, second = _normalize_items(raw, dict(DEFAULT_CFG))[0]
+    for field in ("browser", "provided_kind", "domain"):
+        assert first[field] is second[field]
+    assert first["intent"]["action"] is second["intent"]["action"]
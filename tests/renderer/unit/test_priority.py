@@ -1,5 +1,5 @@
 from core.renderer.config import DEFAULT_CFG
-from core.renderer.priority import _score_item, _select_high_priority
+from core.renderer.priority import _AGGREGATOR_MARKER_RE, _DEPTH_HINT_RE, _score_item, _select_high_priority
 
 
 def _cfg(**overrides):
@@ -101,3 +101,41 @@ def test_select_high_priority_allows_low_conf_paper_exception():
 
     _select_high_priority(buckets, cfg)
     assert [it["url"] for it in buckets["HIGH"]] == ["https://example.com/whitepaper.pdf"]
+
+
+def test_select_high_priority_leaves_untouched_buckets_as_is():
+    cfg = _cfg(highPriorityLimit=1, highPriorityMinScore=0, highPriorityMinIntentConfidence=0.0)
+    doc = _item(url="https://example.com/docs/1")
+    media = [_item(url="https://video.example/1", kind="video", domain_category="video")]
+    buckets = {"DOCS": [doc], "REPOS": [], "MEDIA": media}
+
+    _select_high_priority(buckets, cfg)
+
+    assert buckets["HIGH"] == [doc]
+    assert buckets["DOCS"] == []
+    assert buckets["MEDIA"] is media
+
+
+def test_select_high_priority_breaks_score_ties_by_confidence_then_title():
+    cfg = _cfg(highPriorityLimit=3, highPriorityMinScore=0, highPriorityMinIntentConfidence=0.0)
+    docs = [
+        _item(url=f"https://example.com/docs/{i}", title_render=f"T{i % 4}", intent={"action": "read", "confidence": c})
+        for i, c in enumerate([0.75, 0.9, 0.9, 0.8, 0.95, 0.9])
+    ]
+    buckets = {"DOCS": list(docs), "REPOS": [], "MEDIA": []}
+
+    _select_high_priority(buckets, cfg)
+
+    assert buckets["HIGH"] == [docs[4], docs[1], docs[5]]
+    assert buckets["DOCS"] == [docs[0], docs[2], docs[3]]
+
+
+def test_score_item_marker_patterns_match_inside_words_and_respect_case():
+    for text in ["weekly digest", "stop words"]:
+        assert _AGGREGATOR_MARKER_RE.search(text), text
+    for text in ["nothing here", "", "Top picks"]:
+        assert not _AGGREGATOR_MARKER_RE.search(text), text
+    for path in ["/docs/", "/configure", "/api-reference/x"]:
+        assert _DEPTH_HINT_RE.search(path), path
+    for path in ["/blog/post", ""]:
+        assert not _DEPTH_HINT_RE.search(path), path
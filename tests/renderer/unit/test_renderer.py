@@ -57,3 +57,14 @@ def test_render_markdown_supports_cfg_alias_merge():
     assert "# \U0001F4D1 Tab Dump:" in md
     assert "**Focus:**" not in md
     assert md.endswith("\n")
+
+
+def test_render_markdown_accepts_generator_items():
+    rows = [
+        {"url": "https://example.com/docs/a", "title": "Doc A", "kind": "docs"},
+        {"url": "https://github.com/openai/openai-python", "title": "SDK", "kind": "repo"},
+    ]
+    payload = _payload(rows)
+    streamed = dict(payload, items=(dict(row) for row in rows))
+
+    assert render_markdown(streamed) == render_markdown(_payload([dict(row) for row in rows]))
@@ -37,6 +37,16 @@ def test_top_domains_and_kinds_exclude_admin_entries():
     assert _top_kinds(items, 2) == ["docs", "video"]
 
 
+def test_top_domains_breaks_count_ties_alphabetically_and_counts_blank_slot():
+    items = [_item(domain=d) for d in ["c.com", "b.com", "", "", "", "a.com", "c.com", "b.com"]]
+
+    assert _top_domains(items, 1) == []
+    assert _top_domains(items, 2) == ["b.com"]
+    assert _top_domains(items, 3) == ["b.com", "c.com"]
+    assert _top_domains(items, 4) == ["b.com", "c.com", "a.com"]
+    assert _top_domains([], 3) == []
+
+
 def test_top_topics_excludes_misc_and_admin_entries():
     items = [
         _item(topics=[{"slug": "postgres"}]),
@@ -1,6 +1,6 @@
 import pytest
 
-from core.renderer.validate import _annotate_bucket_on_items, _validate_coverage, _validate_rendered
+from core.renderer.validate import _validate_coverage, _validate_rendered
 
 
 def _buckets_with_all_keys(**overrides):
@@ -19,12 +19,12 @@ def _buckets_with_all_keys(**overrides):
     return buckets
 
 
-def test_annotate_bucket_on_items_sets_bucket_name():
-    buckets = _buckets_with_all_keys(HIGH=[{"url": "https://a"}], DOCS=[{"url": "https://b"}])
-    _annotate_bucket_on_items(buckets)
+def test_validate_coverage_can_annotate_in_the_same_pass():
+    items = [{"url": "https://a"}, {"url": "https://b"}]
+    buckets = _buckets_with_all_keys(HIGH=[items[0]], DOCS=[items[1]])
+    _validate_coverage(items, buckets, annotate=True)
 
-    assert buckets["HIGH"][0]["bucket"] == "HIGH"
-    assert buckets["DOCS"][0]["bucket"] == "DOCS"
+    assert [it["bucket"] for it in items] == ["HIGH", "DOCS"]
 
 
 def test_validate_coverage_success_and_failures():
@@ -0,0 +1,50 @@
+from core.tab_policy.matching import HostBaseSet, host_matches_any_base, query_keys
+
+
+def test_host_matches_any_base_edge_cases():
+    bases = ["Example.com", " www.video.test ", "", None, "a.b"]
+    cases = {
+        ("", True, True): False,
+        (" ", True, True): False,
+        ("WWW.Example.com", True, False): True,
+        ("WWW.Example.com", False, True): True,
+        ("WWW.Example.com", False, False): False,
+        ("sub.example.com", False, True): False,
+        ("notexample.com", True, True): False,
+        ("www.video.test", True, True): False,
+        ("www.video.test", True, False): True,
+        ("video.test", True, False): False,
+        ("x.a.b", True, True): True,
+        ("b", True, True): False,
+    }
+    for (host, enable_suffix, strip_www_host), expected in cases.items():
+        got = host_matches_any_base(host, bases, enable_suffix=enable_suffix, strip_www_host=strip_www_host)
+        assert got is expected, (host, enable_suffix, strip_www_host)
+
+
+def test_host_matches_any_base_handles_empty_and_unhashable_bases():
+    assert not host_matches_any_base("example.com", None)
+    assert not host_matches_any_base("example.com", [])
+    assert host_matches_any_base("api.example.com", [["ignored"], "example.com"])
+    assert not HostBaseSet(["example.com"], enable_suffix=False).matches("api.example.com")
+
+
+def test_query_keys_decodes_key_names_like_parse_qsl():
+    assert query_keys("") == []
+    assert query_keys("a=1&&b") == ["a", "b"]
+    assert query_keys("=x&c=") == ["", "c"]
+    assert query_keys("k=v=w;b=2") == ["k"]
+    assert query_keys("sig%6Eature=1&access+token=2&q%5B%5D=3") == ["signature", "access token", "q[]"]
+    assert query_keys("%zz=1") == ["%zz"]
+
+
+def test_host_base_set_label_walk_edge_cases_for_large_lists():
+    bases = [f"site{i}.example" for i in range(200)] + ["a.b", ".dot", "x..y"]
+    big = HostBaseSet(bases)
+    assert big.label_walk
+    for host in ["site7.example", "api.site7.example", "www.site7.example", "q.a.b", "z..dot", "w.x..y"]:
+        assert big.matches(host), host
+    for host in ["site7.example.evil", "b", "www.b", "www.", ""]:
+        assert not big.matches(host), host
+    assert HostBaseSet(bases, strip_www_host=False).matches("www.q.a.b")
+    assert not HostBaseSet(bases, enable_suffix=False).matches("api.site7.example")
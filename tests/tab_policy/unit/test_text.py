@@ -9,3 +9,18 @@ def test_slugify_kebab_normalizes_text_and_collapse_separators():
 def test_slugify_kebab_uses_fallback_for_empty_values():
     assert slugify_kebab("", fallback="other") == "other"
     assert slugify_kebab("***", fallback="fallback") == "fallback"
+
+
+def test_slugify_kebab_ascii_fast_path_edge_cases():
+    cases = {
+        "-lead": "lead",
+        "trail-": "trail",
+        "--a--b--": "a-b",
+        "Tab\tSep": "tab-sep",
+        "Caf\u00e9 Menu": "caf-menu",
+        "\u00c0B-c": "b-c",
+        "xxx": "xxx",
+        " - ": "misc",
+    }
+    for value, expected in cases.items():
+        assert slugify_kebab(value) == expected, value